@@ -6,19 +6,180 @@ Uses custom graphics algorithms for rendering
 
 import random
 import math
-from typing import List, Tuple
+import functools
+from typing import List, Optional, Tuple
 from graphics_algorithms import (
-    bresenham_line, midpoint_circle, midpoint_ellipse,
-    filled_circle, filled_ellipse, filled_polygon,
+    bresenham_line, bresenham_lines, midpoint_circle, midpoint_ellipse,
+    filled_circle, filled_ellipse, filled_polygon, filled_convex_polygon,
+    polygon_outline, polyline,
     Transform2D, CohenSutherland, SutherlandHodgman
 )
 import numpy as np
+from random_pool import rng, randint
+
+
+# ============================================================================
+# STATIC SHAPES (object space, shared read-only by every instance)
+# ============================================================================
+
+def _shape(points: List[Tuple[float, float]]) -> np.ndarray:
+    """Freeze a vertex list into a read-only (N, 2) float64 array"""
+    vertices = np.array(points, dtype=np.float64)
+    vertices.flags.writeable = False
+    return vertices
+
+
+# Airplane fuselage polygon (centered at origin)
+_AIRPLANE_BODY = _shape([
+    (30, 0),      # Nose
+    (20, 8),      # Top front
+    (-25, 8),     # Top back
+    (-30, 15),    # Tail top
+    (-30, -5),    # Tail bottom
+    (-25, -8),    # Bottom back
+    (20, -8),     # Bottom front
+])
+
+# Airplane wing (top half, mirrored for the bottom; convex)
+_AIRPLANE_WING = _shape([
+    (5, 0),
+    (15, 20),
+    (-10, 20),
+    (-15, 0),
+])
+
+# Airplane horizontal tail wing (top half, mirrored for the bottom; convex)
+_AIRPLANE_TAIL = _shape([
+    (-22, 5),
+    (-18, 12),
+    (-30, 12),
+    (-32, 5),
+])
+
+# Missile body in units of (length, height) - nose pointing LEFT
+_MISSILE_BODY_TEMPLATE = _shape([
+    (-0.5, 0),       # Nose tip (pointing left)
+    (-0.25, 0.5),    # Top front
+    (0.5, 0.5),      # Top back
+    (0.5, 1),        # Fin top
+    (0.5, 0),        # Back center
+    (0.5, -1),       # Fin bottom
+    (0.5, -0.5),     # Bottom back
+    (-0.25, -0.5),   # Bottom front
+])
+
+# The fins overhang the body by a fixed 5 pixels regardless of length
+_MISSILE_FIN_OFFSET = _shape([
+    (0, 0), (0, 0), (0, 0), (5, 0), (0, 0), (5, 0), (0, 0), (0, 0),
+])
+
+# Propeller blade half-offsets (dx, dy) for every 15 degree step of a 12 px blade
+_PROP_OFFSETS = np.array([
+    (int(12 * math.cos(math.radians(a))), int(12 * math.sin(math.radians(a))))
+    for a in range(0, 360, 15)
+], dtype=np.int32)
+
+# Explosion particle palette: yellow, orange, red-orange, white
+_EXPLOSION_COLORS = np.array([
+    (1.0, 0.8, 0.0),
+    (1.0, 0.5, 0.0),
+    (1.0, 0.2, 0.0),
+    (1.0, 1.0, 1.0),
+], dtype=np.float32)
+_EXPLOSION_COLORS.flags.writeable = False
+
+# Fuel canister body (convex)
+_FUEL_CANISTER_BODY = _shape([
+    (-10, -15),
+    (10, -15),
+    (10, 15),
+    (-10, 15),
+])
+
+# Shared default for render-data parts that produce no pixels
+_NO_PIXELS = np.empty((0, 2), dtype=np.int32)
+_NO_PIXELS.flags.writeable = False
+
+
+# ============================================================================
+# RASTERIZED PART TEMPLATES (object space, shared read-only by every instance)
+# ============================================================================
+
+# Templates are rasterized around this anchor and shifted back, so every
+# coordinate is positive while rasterizing and int() truncation acts as floor,
+# exactly as it does for an object drawn at an integer screen position
+_TEMPLATE_ANCHOR = 256
+
+
+def _freeze_offsets(pixels: np.ndarray) -> np.ndarray:
+    """Shift anchored pixels back to int32 offsets from the object's position, read-only"""
+    offsets = pixels.astype(np.int32) - np.int32(_TEMPLATE_ANCHOR)
+    offsets.flags.writeable = False
+    return offsets
+
+
+def _translated(offsets: np.ndarray, x: float, y: float) -> np.ndarray:
+    """
+    Template offsets moved to (int(x), int(y))
+    The position is an int32 array, since adding a Python tuple would promote to int64
+    """
+    return offsets + np.array((int(x), int(y)), dtype=np.int32)
+
+
+@functools.lru_cache(maxsize=64)
+def _airplane_template(rotation: int) -> dict:
+    """
+    Airplane parts rasterized once per whole-degree tilt, as pixel offsets from (x, y)
+    The propeller animates, so it is not part of the template
+    """
+    a = _TEMPLATE_ANCHOR
+    matrix = Transform2D.affine_trs_matrix(a, a, rotation, 1.0, 1.0)
+    mirrored = Transform2D.mirror_local_y(matrix)
+    
+    body_verts = Transform2D.transform_points(_AIRPLANE_BODY, matrix)
+    wings = np.vstack((filled_convex_polygon(Transform2D.transform_points(_AIRPLANE_WING, matrix)),
+                       filled_convex_polygon(Transform2D.transform_points(_AIRPLANE_WING, mirrored))))
+    tail = np.vstack((filled_convex_polygon(Transform2D.transform_points(_AIRPLANE_TAIL, matrix)),
+                      filled_convex_polygon(Transform2D.transform_points(_AIRPLANE_TAIL, mirrored))))
+    cockpit_center = Transform2D.transform_point((10, 3), matrix)
+    engine_center = Transform2D.transform_point((25, 0), matrix)
+    
+    return {
+        'body': _freeze_offsets(filled_polygon(body_verts)),
+        'body_outline': _freeze_offsets(polygon_outline(body_verts)),
+        'wings': _freeze_offsets(wings),
+        'tail': _freeze_offsets(tail),
+        'cockpit': _freeze_offsets(filled_ellipse(int(cockpit_center[0]), int(cockpit_center[1]), 8, 5)),
+        'engine': _freeze_offsets(filled_circle(int(engine_center[0]), int(engine_center[1]), 6)),
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _missile_template(length: int, height: int) -> dict:
+    """
+    Missile body, outline and nose rasterized once per size, as pixel offsets from (x, y)
+    Missiles never rotate or scale; the flickering flame is not part of the template
+    """
+    a = _TEMPLATE_ANCHOR
+    body_verts = _MISSILE_BODY_TEMPLATE * (length, height) + _MISSILE_FIN_OFFSET + a
+    return {
+        'body': _freeze_offsets(filled_polygon(body_verts)),
+        'outline': _freeze_offsets(polygon_outline(body_verts)),
+        'nose': _freeze_offsets(filled_ellipse(int(a - length / 2 + 5), a, 8, 4)),
+    }
 
 
 class GameObject:
     """Base class for all game objects"""
     
+    # Pixels drawn beyond the bounding box (trails, caps, ...), used when culling
+    render_margin = 0
+    
     def __init__(self, x: float, y: float):
+        # Cached 2x3 affine T @ R @ S, rebuilt only after x/y/rotation/scale change
+        self._xform = np.empty((2, 3))
+        self._xform_dirty = True
+        
         self.x = x
         self.y = y
         self.velocity_x = 0
@@ -28,35 +189,86 @@ class GameObject:
         self.active = True
         self.color = (1.0, 1.0, 1.0)  # RGB
     
+    @property
+    def x(self) -> float:
+        return self._x
+    
+    @x.setter
+    def x(self, value: float):
+        self._x = value
+        self._xform_dirty = True
+    
+    @property
+    def y(self) -> float:
+        return self._y
+    
+    @y.setter
+    def y(self, value: float):
+        self._y = value
+        self._xform_dirty = True
+    
+    @property
+    def rotation(self) -> float:
+        return self._rot
+    
+    @rotation.setter
+    def rotation(self, value: float):
+        self._rot = value
+        self._xform_dirty = True
+    
+    @property
+    def scale(self) -> float:
+        return self._scale
+    
+    @scale.setter
+    def scale(self, value: float):
+        self._scale = value
+        self._xform_dirty = True
+    
     def update(self, dt: float):
         """Update object position"""
         self.x += self.velocity_x * dt
         self.y += self.velocity_y * dt
     
     def get_transform_matrix(self) -> np.ndarray:
-        """Get the combined transformation matrix"""
-        T = Transform2D.translation_matrix(self.x, self.y)
-        R = Transform2D.rotation_matrix(self.rotation)
-        S = Transform2D.scaling_matrix(self.scale, self.scale)
-        return T @ R @ S
+        """
+        Get the combined transformation matrix T @ R @ S as a 2x3 affine matrix
+        Filled in closed form and cached until the object moves;
+        the returned array is shared, so callers must not modify it
+        """
+        if self._xform_dirty:
+            Transform2D.affine_trs_matrix(self._x, self._y, self._rot, self._scale, self._scale,
+                                   out=self._xform)
+            self._xform_dirty = False
+        return self._xform
     
     def get_vertices(self) -> List[Tuple[float, float]]:
         """Override in subclasses to return object vertices"""
         return []
     
-    def get_transformed_vertices(self) -> List[Tuple[float, float]]:
-        """Get vertices after applying transformations"""
+    def get_transformed_vertices(self) -> np.ndarray:
+        """Get vertices after applying transformations, as an (N, 2) array"""
         matrix = self.get_transform_matrix()
         return Transform2D.transform_points(self.get_vertices(), matrix)
     
     def get_bounding_box(self) -> Tuple[float, float, float, float]:
         """Returns (min_x, min_y, max_x, max_y)"""
         vertices = self.get_transformed_vertices()
-        if not vertices:
+        if len(vertices) == 0:
             return (self.x - 10, self.y - 10, self.x + 10, self.y + 10)
-        xs = [v[0] for v in vertices]
-        ys = [v[1] for v in vertices]
-        return (min(xs), min(ys), max(xs), max(ys))
+        min_x, min_y = vertices.min(axis=0)
+        max_x, max_y = vertices.max(axis=0)
+        return (min_x, min_y, max_x, max_y)
+    
+    def is_visible(self, viewport_w: float, viewport_h: float) -> bool:
+        """
+        AABB test against the viewport [0, w] x [0, h]
+        Callers skip get_render_data entirely for objects that fail it
+        """
+        min_x, min_y, max_x, max_y = self.get_bounding_box()
+        margin = self.render_margin + 1  # int() truncation can shift a pixel by one
+        return (max_x + margin >= 0 and min_x - margin <= viewport_w and
+                max_y + margin >= 0 and min_y - margin <= viewport_h)
     
     def collides_with(self, other: 'GameObject') -> bool:
         """Simple AABB collision detection"""
@@ -96,36 +308,17 @@ class Airplane(GameObject):
         self.wing_span = 40
         self.tail_height = 20
     
-    def get_vertices(self) -> List[Tuple[float, float]]:
+    def get_vertices(self) -> np.ndarray:
         """Return airplane body vertices (fuselage polygon)"""
-        # Fuselage shape
-        return [
-            (30, 0),      # Nose
-            (20, 8),      # Top front
-            (-25, 8),     # Top back
-            (-30, 15),    # Tail top
-            (-30, -5),    # Tail bottom
-            (-25, -8),    # Bottom back
-            (20, -8),     # Bottom front
-        ]
-    
-    def get_wing_vertices(self) -> List[Tuple[float, float]]:
+        return _AIRPLANE_BODY
+    
+    def get_wing_vertices(self) -> np.ndarray:
         """Return wing vertices"""
-        return [
-            (5, 0),
-            (15, 20),
-            (-10, 20),
-            (-15, 0),
-        ]
-    
-    def get_tail_wing_vertices(self) -> List[Tuple[float, float]]:
+        return _AIRPLANE_WING
+    
+    def get_tail_wing_vertices(self) -> np.ndarray:
         """Return horizontal tail wing vertices"""
-        return [
-            (-22, 5),
-            (-18, 12),
-            (-30, 12),
-            (-32, 5),
-        ]
+        return _AIRPLANE_TAIL
     
     def get_render_data(self) -> dict:
         """
@@ -134,68 +327,26 @@ class Airplane(GameObject):
         """
         matrix = self.get_transform_matrix()
         
-        data = {
-            'body': [],
-            'body_outline': [],
-            'wings': [],
-            'tail': [],
-            'cockpit': [],
-            'propeller': [],
-            'engine': []
-        }
-        
-        # Body (fuselage)
-        body_verts = Transform2D.transform_points(self.get_vertices(), matrix)
-        data['body'] = filled_polygon(body_verts)
-        data['body_outline'] = self._get_polygon_outline(body_verts)
-        
-        # Wings (top and bottom)
-        wing_verts_top = Transform2D.transform_points(self.get_wing_vertices(), matrix)
-        wing_matrix_bottom = matrix @ Transform2D.scaling_matrix(1, -1)
-        wing_verts_bottom = Transform2D.transform_points(self.get_wing_vertices(), wing_matrix_bottom)
-        data['wings'] = filled_polygon(wing_verts_top) + filled_polygon(wing_verts_bottom)
-        
-        # Tail wing
-        tail_verts_top = Transform2D.transform_points(self.get_tail_wing_vertices(), matrix)
-        tail_matrix_bottom = matrix @ Transform2D.scaling_matrix(1, -1)
-        tail_verts_bottom = Transform2D.transform_points(self.get_tail_wing_vertices(), tail_matrix_bottom)
-        data['tail'] = filled_polygon(tail_verts_top) + filled_polygon(tail_verts_bottom)
-        
-        # Cockpit (ellipse)
-        cockpit_center = Transform2D.transform_point((10, 3), matrix)
-        data['cockpit'] = filled_ellipse(int(cockpit_center[0]), int(cockpit_center[1]), 8, 5)
-        
-        # Engine (circle)
-        engine_center = Transform2D.transform_point((25, 0), matrix)
-        data['engine'] = filled_circle(int(engine_center[0]), int(engine_center[1]), 6)
+        # Rigid parts come from the rasterized template for this tilt, moved into place
+        template = _airplane_template(int(round(self.rotation)))
+        data = {part: _translated(pixels, self.x, self.y) for part, pixels in template.items()}
         
         # Propeller (rotating lines)
-        self.propeller_angle += 15  # Rotate propeller
+        self.propeller_angle = (self.propeller_angle + 15) % 360  # Rotate propeller
         prop_center = Transform2D.transform_point((32, 0), matrix)
-        prop_length = 12
-        
-        for offset in [0, 90]:  # Two blades
-            angle = math.radians(self.propeller_angle + offset + self.rotation)
-            dx = prop_length * math.cos(angle)
-            dy = prop_length * math.sin(angle)
-            px, py = int(prop_center[0]), int(prop_center[1])
-            data['propeller'].extend(bresenham_line(
-                px - int(dx), py - int(dy),
-                px + int(dx), py + int(dy)
-            ))
+        px, py = int(prop_center[0]), int(prop_center[1])
+        
+        # The angle only moves in 15 degree steps, so blade offsets come from a
+        # table; the body tilt is folded in at the same 15 degree resolution
+        idx = (int(self.propeller_angle / 15) + int(self.rotation / 15)) % 24
+        blades = []
+        for step in [0, 6]:  # Two blades, 90 degrees apart
+            dx, dy = _PROP_OFFSETS[(idx + step) % 24]
+            blades.append(bresenham_line(px - dx, py - dy, px + dx, py + dy))
+        data['propeller'] = np.concatenate(blades)
         
         return data
     
-    def _get_polygon_outline(self, vertices: List[Tuple[float, float]]) -> List[Tuple[int, int]]:
-        """Get outline pixels using Bresenham's algorithm"""
-        points = []
-        n = len(vertices)
-        for i in range(n):
-            x1, y1 = int(vertices[i][0]), int(vertices[i][1])
-            x2, y2 = int(vertices[(i + 1) % n][0]), int(vertices[(i + 1) % n][1])
-            points.extend(bresenham_line(x1, y1, x2, y2))
-        return points
-    
     def update(self, dt: float, keys: dict):
         """Update airplane based on input"""
         # Vertical movement
@@ -237,78 +388,195 @@ class Missile(GameObject):
     """
     Enemy missile/obstacle
     Drawn using midpoint ellipse and Bresenham's lines
+    Kinematic state lives in a MissilePool slot; each Missile is a view onto it
     """
     
-    def __init__(self, x: float, y: float):
-        super().__init__(x, y)
-        self.velocity_x = -random.uniform(150, 300)  # Move left
-        self.velocity_y = random.uniform(-50, 50)
+    # Nose cone overhangs the tip by 3 px; the flame reaches 30 px past the fins
+    render_margin = 32
+    
+    def __init__(self, pool: 'MissilePool', slot: int):
+        self._pool = pool
+        self._slot = slot
+        super().__init__(pool.x[slot], pool.y[slot])
         self.color = (1.0, 0.2, 0.2)  # Red
         self.body_color = (0.6, 0.6, 0.6)  # Gray
-        self.length = random.randint(30, 50)
-        self.height = 8
         self.trail_particles = []
+        self.reset()
     
-    def get_vertices(self) -> List[Tuple[float, float]]:
+    def reset(self):
+        """Rebuild per-spawn data after the pool refills this missile's slot"""
+        # Length is fixed per spawn, so the body polygon is built once
+        self._body_vertices = (_MISSILE_BODY_TEMPLATE * (self.length, self.height)
+                               + _MISSILE_FIN_OFFSET)
+    
+    @property
+    def x(self) -> float:
+        return self._pool.x[self._slot]
+    
+    @x.setter
+    def x(self, value: float):
+        self._pool.x[self._slot] = value
+    
+    @property
+    def y(self) -> float:
+        return self._pool.y[self._slot]
+    
+    @y.setter
+    def y(self, value: float):
+        self._pool.y[self._slot] = value
+    
+    @property
+    def velocity_x(self) -> float:
+        return self._pool.vx[self._slot]
+    
+    @velocity_x.setter
+    def velocity_x(self, value: float):
+        self._pool.vx[self._slot] = value
+    
+    @property
+    def velocity_y(self) -> float:
+        return self._pool.vy[self._slot]
+    
+    @velocity_y.setter
+    def velocity_y(self, value: float):
+        self._pool.vy[self._slot] = value
+    
+    @property
+    def active(self) -> bool:
+        return bool(self._pool.active[self._slot])
+    
+    @active.setter
+    def active(self, value: bool):
+        self._pool.active[self._slot] = value
+    
+    @property
+    def length(self) -> int:
+        return int(self._pool.length[self._slot])
+    
+    @property
+    def height(self) -> int:
+        return int(self._pool.height[self._slot])
+    
+    def get_vertices(self) -> np.ndarray:
         """Missile body vertices - nose pointing LEFT (direction of travel)"""
-        l = self.length
-        h = self.height
-        return [
-            (-l/2, 0),       # Nose tip (pointing left)
-            (-l/4, h/2),     # Top front
-            (l/2, h/2),      # Top back
-            (l/2 + 5, h),    # Fin top
-            (l/2, 0),        # Back center
-            (l/2 + 5, -h),   # Fin bottom
-            (l/2, -h/2),     # Bottom back
-            (-l/4, -h/2),    # Bottom front
-        ]
+        return self._body_vertices
+    
+    def get_transform_matrix(self) -> np.ndarray:
+        """Missiles move every frame, so always build a fresh matrix instead of caching"""
+        return Transform2D.affine_trs_matrix(self.x, self.y, self.rotation, self.scale, self.scale)
     
     def get_render_data(self) -> dict:
         """Get render data for missile"""
         matrix = self.get_transform_matrix()
         
-        data = {
-            'body': [],
-            'nose': [],
-            'flame': [],
-            'outline': []
-        }
-        
-        # Body
-        body_verts = Transform2D.transform_points(self.get_vertices(), matrix)
-        data['body'] = filled_polygon(body_verts)
-        data['outline'] = self._get_polygon_outline(body_verts)
-        
-        # Nose cone (using ellipse) - pointing left
-        nose_pos = Transform2D.transform_point((-self.length/2 + 5, 0), matrix)
-        data['nose'] = filled_ellipse(int(nose_pos[0]), int(nose_pos[1]), 8, 4)
+        # Body, outline and nose come from the rasterized template for this size
+        template = _missile_template(self.length, self.height)
+        data = {part: _translated(pixels, self.x, self.y) for part, pixels in template.items()}
         
         # Flame trail - at the back (right side)
         flame_pos = Transform2D.transform_point((self.length/2 + 5, 0), matrix)
-        flame_length = random.randint(10, 20)
-        for i in range(3):
-            offset = random.randint(-3, 3)
-            data['flame'].extend(bresenham_line(
-                int(flame_pos[0]), int(flame_pos[1]),
-                int(flame_pos[0] + flame_length + i*5), int(flame_pos[1] + offset)
-            ))
+        flame_length = randint(10, 20)
+        fx, fy = int(flame_pos[0]), int(flame_pos[1])
+        streaks = [(fx, fy,
+                    int(flame_pos[0] + flame_length + i*5), int(flame_pos[1] + randint(-3, 3)))
+                   for i in range(3)]
+        # All three streaks in one rasterizer call
+        data['flame'] = bresenham_lines(streaks)
         
         return data
     
-    def _get_polygon_outline(self, vertices):
-        points = []
-        n = len(vertices)
-        for i in range(n):
-            x1, y1 = int(vertices[i][0]), int(vertices[i][1])
-            x2, y2 = int(vertices[(i + 1) % n][0]), int(vertices[(i + 1) % n][1])
-            points.extend(bresenham_line(x1, y1, x2, y2))
-        return points
-    
     def update(self, dt: float):
-        super().update(dt)
+        """Advance just this missile's slot; the game loop moves the whole pool at once"""
+        self._pool.advance(dt, self._slot)
+
+
+class MissilePool:
+    """
+    Fixed-capacity missile pool stored as parallel arrays (SoA)
+    Spawning fills a free slot instead of allocating, and all missiles
+    are moved together by one vectorized update
+    """
+    
+    MAX_MISSILES = 64
+    
+    def __init__(self, capacity: int = MAX_MISSILES):
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.length = np.zeros(capacity, dtype=np.int32)
+        self.height = np.zeros(capacity, dtype=np.int32)
+        self.active = np.zeros(capacity, dtype=bool)
+        
+        # One view object per slot, created once and reused on every spawn
+        self._missiles = [Missile(self, i) for i in range(capacity)]
+        self.active[:] = False
+    
+    def spawn(self, x: float, y: float) -> Optional[Missile]:
+        """Activate the first free slot as a new missile; None if the pool is full"""
+        free = np.flatnonzero(~self.active)
+        if len(free) == 0:
+            return None
+        
+        i = free[0]
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = -random.uniform(150, 300)  # Move left
+        self.vy[i] = random.uniform(-50, 50)
+        self.length[i] = random.randint(30, 50)
+        self.height[i] = 8
+        self.active[i] = True
+        
+        missile = self._missiles[i]
+        missile.reset()
+        return missile
+    
+    def despawn(self, missile: Missile):
+        """Return a missile's slot to the pool"""
+        self.active[missile._slot] = False
+    
+    def update_all(self, dt: float):
+        """
+        Move every missile at once
+        Free slots are advanced too - cheaper than masking, and spawn overwrites them
+        """
+        self.advance(dt, slice(None))
+    
+    def advance(self, dt: float, slots=slice(None)):
+        """Integrate the missiles in slots (an index, slice or mask) by dt"""
+        self.x[slots] += self.vx[slots] * dt
+        self.y[slots] += self.vy[slots] * dt
         # Slight wave motion
-        self.velocity_y = 30 * math.sin(self.x * 0.02)
+        self.vy[slots] = 30 * np.sin(self.x[slots] * 0.02)
+    
+    def first_collision(self, other: GameObject) -> Optional[Missile]:
+        """
+        First active missile whose bounding box overlaps other's, or None
+        Same AABB test as GameObject.collides_with, done for the whole pool at once;
+        missiles never rotate or scale, so each box follows from x, y, length and height
+        """
+        min_x, min_y, max_x, max_y = other.get_bounding_box()
+        half = self.length * 0.5
+        overlap = (self.active
+                   & (self.x - half <= max_x) & (self.x + half + 5 >= min_x)
+                   & (self.y - self.height <= max_y) & (self.y + self.height >= min_y))
+        if not overlap.any():
+            return None
+        return self._missiles[int(np.argmax(overlap))]
+    
+    def despawn_behind(self, min_x: float) -> int:
+        """Despawn every active missile left of min_x; returns how many were removed"""
+        gone = self.active & (self.x < min_x)
+        self.active &= ~gone
+        return int(np.count_nonzero(gone))
+    
+    def __iter__(self):
+        """Iterate over the active missiles"""
+        for i in np.flatnonzero(self.active):
+            yield self._missiles[i]
+    
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.active))
 
 
 class Cloud(GameObject):
@@ -319,34 +587,41 @@ class Cloud(GameObject):
     
     def __init__(self, x: float, y: float):
         super().__init__(x, y)
-        self.velocity_x = -random.uniform(20, 50)  # Slow drift left
         self.color = (1.0, 1.0, 1.0)  # White
+        self.reset(x, y)
+    
+    def reset(self, x: float, y: float):
+        """Re-spawn this cloud at (x, y) with a new shape, so clouds can be reused"""
+        self.x = x
+        self.y = y
+        self.velocity_x = -random.uniform(20, 50)  # Slow drift left
         self.alpha = random.uniform(0.3, 0.7)
         self.circles = self._generate_cloud_shape()
+        
+        # The shape never changes after spawning, so its discs are rasterized once
+        # as offsets from (x, y); the rasterized templates are already cached per radius
+        self._disc_offsets = np.concatenate([filled_circle(cx, cy, r) for cx, cy, r in self.circles])
+        
+        # Loose extents of the circle cluster around (x, y), for culling
+        self._extent_x = max(abs(cx) + r for cx, cy, r in self.circles)
+        self._extent_y = max(abs(cy) + r for cx, cy, r in self.circles)
     
     def _generate_cloud_shape(self) -> List[Tuple[int, int, int]]:
         """Generate random cloud shape as collection of circles (x, y, r)"""
-        circles = []
-        num_circles = random.randint(3, 6)
-        
-        for i in range(num_circles):
-            cx = random.randint(-30, 30)
-            cy = random.randint(-10, 10)
-            r = random.randint(15, 30)
-            circles.append((cx, cy, r))
-        
-        return circles
+        num_circles = int(rng.integers(3, 7))
+        cx = rng.integers(-30, 31, num_circles)
+        cy = rng.integers(-10, 11, num_circles)
+        r = rng.integers(15, 31, num_circles)
+        return list(zip(cx.tolist(), cy.tolist(), r.tolist()))
+    
+    def get_bounding_box(self) -> Tuple[float, float, float, float]:
+        """Loose box from (x, y) ± the precomputed circle extents, no vertex transform"""
+        return (self.x - self._extent_x, self.y - self._extent_y,
+                self.x + self._extent_x, self.y + self._extent_y)
     
     def get_render_data(self) -> dict:
         """Get render data for cloud"""
-        data = {'circles': []}
-        
-        for cx, cy, r in self.circles:
-            world_x = int(self.x + cx)
-            world_y = int(self.y + cy)
-            data['circles'].extend(filled_circle(world_x, world_y, r))
-        
-        return data
+        return {'circles': _translated(self._disc_offsets, self.x, self.y)}
 
 
 class FuelCanister(GameObject):
@@ -355,6 +630,9 @@ class FuelCanister(GameObject):
     Drawn using rectangles and circles
     """
     
+    # Cap circle reaches 9 px above the body, plus up to 5 px of bobbing
+    render_margin = 15
+    
     def __init__(self, x: float, y: float):
         super().__init__(x, y)
         self.velocity_x = -100
@@ -363,14 +641,15 @@ class FuelCanister(GameObject):
         self.bob_offset = 0
         self.bob_speed = 5
     
-    def get_vertices(self) -> List[Tuple[float, float]]:
+    def reset(self, x: float, y: float):
+        """Re-spawn this canister at (x, y), so canisters can be reused"""
+        self.x = x
+        self.y = y
+        self.bob_offset = 0
+    
+    def get_vertices(self) -> np.ndarray:
         """Canister body"""
-        return [
-            (-10, -15),
-            (10, -15),
-            (10, 15),
-            (-10, 15),
-        ]
+        return _FUEL_CANISTER_BODY
     
     def get_render_data(self) -> dict:
         matrix = self.get_transform_matrix()
@@ -381,14 +660,14 @@ class FuelCanister(GameObject):
         matrix = matrix @ bob_matrix
         
         data = {
-            'body': [],
-            'cap': [],
-            'symbol': []
+            'body': _NO_PIXELS,
+            'cap': _NO_PIXELS,
+            'symbol': _NO_PIXELS
         }
         
         # Body
         body_verts = Transform2D.transform_points(self.get_vertices(), matrix)
-        data['body'] = filled_polygon(body_verts)
+        data['body'] = filled_convex_polygon(body_verts)
         
         # Cap (circle on top)
         cap_pos = Transform2D.transform_point((0, -18), matrix)
@@ -397,8 +676,10 @@ class FuelCanister(GameObject):
         # Plus symbol for fuel
         center = Transform2D.transform_point((0, 0), matrix)
         cx, cy = int(center[0]), int(center[1])
-        data['symbol'].extend(bresenham_line(cx - 5, cy, cx + 5, cy))
-        data['symbol'].extend(bresenham_line(cx, cy - 5, cx, cy + 5))
+        data['symbol'] = np.concatenate([
+            bresenham_line(cx - 5, cy, cx + 5, cy),
+            bresenham_line(cx, cy - 5, cx, cy + 5)
+        ])
         
         return data
     
@@ -406,33 +687,59 @@ class FuelCanister(GameObject):
         super().update(dt)
 
 
-class Star(GameObject):
+class StarField:
     """
-    Background star for parallax effect
+    Background stars for parallax effect
+    Stored as parallel arrays (one entry per star) so all stars move, wrap
+    and twinkle in a few vectorized steps instead of one object each
     """
     
-    def __init__(self, x: float, y: float, layer: int = 0):
-        super().__init__(x, y)
-        self.layer = layer  # 0 = far, 1 = mid, 2 = near
-        self.velocity_x = -20 * (layer + 1)  # Parallax speed
-        self.brightness = random.uniform(0.3, 1.0)
-        self.size = random.randint(1, 2 + layer)
-        self.twinkle_phase = random.uniform(0, 2 * math.pi)
+    def __init__(self, width: int, height: int, stars_per_layer: int = 20, layers: int = 3):
+        self.width = width
+        self.height = height
+        n = stars_per_layer * layers
+        
+        self.layer = np.repeat(np.arange(layers), stars_per_layer)  # 0 = far, 1 = mid, 2 = near
+        self.x = rng.integers(0, width + 1, n).astype(np.float64)
+        self.y = rng.integers(100, height - 49, n).astype(np.float64)
+        self.speed = 20.0 * (self.layer + 1)  # Parallax speed
+        self.brightness = rng.uniform(0.3, 1.0, n)
+        self.size = rng.integers(1, 3 + self.layer)  # Nearer layers allow bigger stars
+        self.twinkle_phase = rng.uniform(0, 2 * np.pi, n)
+        
+        # Sizes never change, so every star's pixel offsets are laid out once,
+        # back to back, with the index of the star each pixel belongs to
+        shapes = [np.zeros((1, 2), dtype=np.int32) if size == 1 else filled_circle(0, 0, size)
+                  for size in self.size.tolist()]
+        self._offsets = np.concatenate(shapes)
+        self._owner = np.repeat(np.arange(n), [len(shape) for shape in shapes])
+    
+    def __len__(self) -> int:
+        return len(self.x)
+    
+    def update(self, dt: float):
+        """Scroll every star left; stars leaving the screen wrap to the right edge"""
+        self.x -= self.speed * dt
+        wrapped = self.x < 0
+        count = int(np.count_nonzero(wrapped))
+        if count:
+            self.x[wrapped] = self.width
+            self.y[wrapped] = rng.integers(100, self.height - 49, count)
     
     def get_render_data(self) -> dict:
+        """
+        All star pixels as one (N, 2) int32 array with each pixel's twinkled
+        brightness, in layer order (far first)
+        """
         # Twinkle effect
-        twinkle = 0.5 + 0.5 * math.sin(self.twinkle_phase)
+        brightness = self.brightness * (0.5 + 0.5 * np.sin(self.twinkle_phase))
         self.twinkle_phase += 0.1
         
-        data = {'points': []}
-        
-        if self.size == 1:
-            data['points'] = [(int(self.x), int(self.y))]
-        else:
-            data['points'] = filled_circle(int(self.x), int(self.y), self.size)
-        
-        data['brightness'] = self.brightness * twinkle
-        return data
+        positions = np.column_stack((self.x, self.y)).astype(np.int32)
+        return {
+            'points': positions[self._owner] + self._offsets,
+            'brightness': brightness[self._owner]
+        }
 
 
 class Explosion(GameObject):
@@ -443,28 +750,33 @@ class Explosion(GameObject):
     def __init__(self, x: float, y: float):
         super().__init__(x, y)
         self.lifetime = 0.5  # seconds
+        self.reset(x, y)
+    
+    def reset(self, x: float, y: float):
+        """Restart this explosion at (x, y) with new particles, so explosions can be reused"""
+        self.x = x
+        self.y = y
+        self.active = True
         self.age = 0
-        self.particles = []
         self._generate_particles()
     
     def _generate_particles(self):
-        """Generate explosion particles"""
-        for _ in range(20):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 200)
-            self.particles.append({
-                'x': self.x,
-                'y': self.y,
-                'vx': speed * math.cos(angle),
-                'vy': speed * math.sin(angle),
-                'size': random.randint(2, 6),
-                'color': random.choice([
-                    (1.0, 0.8, 0.0),   # Yellow
-                    (1.0, 0.5, 0.0),   # Orange
-                    (1.0, 0.2, 0.0),   # Red-orange
-                    (1.0, 1.0, 1.0),   # White
-                ])
-            })
+        """
+        Generate explosion particles
+        Stored as parallel float32 arrays (one entry per particle) so update is vectorized
+        """
+        n = 20
+        self.px = np.full(n, self.x, dtype=np.float32)
+        self.py = np.full(n, self.y, dtype=np.float32)
+        
+        # One batched draw per field
+        angles = rng.uniform(0, 2 * np.pi, n)
+        speeds = rng.uniform(50, 200, n)
+        self.vx = (speeds * np.cos(angles)).astype(np.float32)
+        self.vy = (speeds * np.sin(angles)).astype(np.float32)
+        self.size = rng.integers(2, 7, n).astype(np.float32)
+        self.colors = _EXPLOSION_COLORS[rng.integers(0, len(_EXPLOSION_COLORS), n)]  # (n, 3) RGB
+        self.max_particle_radius = int(self.size.max())
     
     def update(self, dt: float):
         self.age += dt
@@ -472,27 +784,31 @@ class Explosion(GameObject):
             self.active = False
             return
         
-        for p in self.particles:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['vy'] -= 200 * dt  # Gravity
-            p['size'] = max(1, p['size'] - 5 * dt)
+        self.px += self.vx * dt
+        self.py += self.vy * dt
+        self.vy -= 200 * dt  # Gravity
+        np.maximum(self.size - 5 * dt, 1, out=self.size)
+        self.max_particle_radius = int(self.size.max())
+    
+    def get_bounding_box(self) -> Tuple[float, float, float, float]:
+        """Box around the particle centres, grown by the largest particle radius"""
+        r = self.max_particle_radius
+        return (float(self.px.min()) - r, float(self.py.min()) - r,
+                float(self.px.max()) + r, float(self.py.max()) + r)
     
     def get_render_data(self) -> dict:
-        data = {'particles': []}
-        
-        alpha = 1.0 - (self.age / self.lifetime)
-        
-        for p in self.particles:
-            if p['size'] >= 1:
-                points = filled_circle(int(p['x']), int(p['y']), int(p['size']))
-                data['particles'].append({
-                    'points': points,
-                    'color': p['color'],
-                    'alpha': alpha
-                })
-        
-        return data
+        # Per-particle pixel blocks plus the shared colour array rather than
+        # one dict per particle; each particle is drawn as one colour run
+        points = [filled_circle(x, y, size) for x, y, size in
+                  zip(self.px.astype(np.int32).tolist(),
+                      self.py.astype(np.int32).tolist(),
+                      self.size.astype(np.int32).tolist())]
+        
+        return {
+            'points': points,
+            'colors': self.colors,
+            'alpha': 1.0 - (self.age / self.lifetime)
+        }
 
 
 class Ground(GameObject):
@@ -504,7 +820,7 @@ class Ground(GameObject):
         super().__init__(0, 0)
         self.width = width
         self.ground_height = height
-        self.terrain_points = self._generate_terrain()
+        self._terrain = np.array(self._generate_terrain(), dtype=np.float32)
         self.scroll_x = 0
     
     def _generate_terrain(self) -> List[Tuple[float, float]]:
@@ -519,28 +835,23 @@ class Ground(GameObject):
         return points
     
     def get_render_data(self) -> dict:
-        data = {'ground': [], 'grass': []}
+        data = {'ground': _NO_PIXELS, 'grass': _NO_PIXELS}
         
-        # Create ground polygon
-        visible_points = []
-        for px, py in self.terrain_points:
-            screen_x = px - self.scroll_x
-            if -50 < screen_x < self.width + 50:
-                visible_points.append((screen_x, py))
+        # Visible terrain points, selected with one vectorized mask
+        screen_x = self._terrain[:, 0] - self.scroll_x
+        mask = (screen_x > -50) & (screen_x < self.width + 50)
+        visible_points = np.column_stack((screen_x[mask], self._terrain[mask, 1]))
         
         if len(visible_points) >= 2:
             # Close the polygon at the bottom
-            ground_poly = visible_points + [
-                (visible_points[-1][0], 0),
-                (visible_points[0][0], 0)
-            ]
+            ground_poly = np.vstack((visible_points, [
+                (visible_points[-1, 0], 0),
+                (visible_points[0, 0], 0)
+            ]))
             data['ground'] = filled_polygon(ground_poly)
             
             # Grass line on top
-            for i in range(len(visible_points) - 1):
-                x1, y1 = int(visible_points[i][0]), int(visible_points[i][1])
-                x2, y2 = int(visible_points[i+1][0]), int(visible_points[i+1][1])
-                data['grass'].extend(bresenham_line(x1, y1, x2, y2))
+            data['grass'] = polyline(visible_points)
         
         return data
     
@@ -3,236 +3,165 @@ Computer Graphics Algorithms Module
 Implements: Bresenham's Line, Midpoint Circle/Ellipse, Transformations, Clipping
 """
 
+import functools
+import math
 import numpy as np
 from typing import List, Tuple
+from graphics_numba import (
+    _bresenham, _polygon_outline, _polyline, _line_segments,
+    _filled_polygon, _filled_convex_polygon, _midpoint_circle, _midpoint_ellipse,
+    _cs_code, _cs_clip, _sh_clip_rect
+)
 
 # ============================================================================
 # BRESENHAM'S LINE DRAWING ALGORITHM
 # ============================================================================
 
-def bresenham_line(x1: int, y1: int, x2: int, y2: int) -> List[Tuple[int, int]]:
+def bresenham_line(x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
     """
     Bresenham's Line Drawing Algorithm
-    Returns list of (x, y) pixel coordinates forming a line from (x1,y1) to (x2,y2)
+    Returns (N, 2) int32 array of (x, y) pixel coordinates forming a line from (x1,y1) to (x2,y2)
     """
-    points = []
-    
-    dx = abs(x2 - x1)
-    dy = abs(y2 - y1)
-    
-    x, y = x1, y1
-    
-    sx = 1 if x2 > x1 else -1
-    sy = 1 if y2 > y1 else -1
-    
-    if dx > dy:
-        # Slope < 1
-        p = 2 * dy - dx
-        for _ in range(dx + 1):
-            points.append((x, y))
-            if p >= 0:
-                y += sy
-                p -= 2 * dx
-            p += 2 * dy
-            x += sx
-    else:
-        # Slope >= 1
-        p = 2 * dx - dy
-        for _ in range(dy + 1):
-            points.append((x, y))
-            if p >= 0:
-                x += sx
-                p -= 2 * dy
-            p += 2 * dx
-            y += sy
-    
-    return points
+    n = max(abs(x2 - x1), abs(y2 - y1)) + 1
+    out = np.empty((n, 2), dtype=np.int32)
+    return _bresenham(x1, y1, x2, y2, out)
+
+
+def bresenham_lines(segments) -> np.ndarray:
+    """
+    Bresenham pixels of several (x1, y1, x2, y2) lines, back to back
+    All lines are rasterized in one kernel call into a single preallocated array;
+    returns (N, 2) int32 array of (x, y) pixel coordinates
+    """
+    segments = np.ascontiguousarray(segments, dtype=np.int32).reshape(-1, 4)
+    return _line_segments(segments)
 
 
 # ============================================================================
 # MIDPOINT CIRCLE ALGORITHM
 # ============================================================================
 
-def midpoint_circle(xc: int, yc: int, r: int) -> List[Tuple[int, int]]:
+def midpoint_circle(xc: int, yc: int, r: int) -> np.ndarray:
     """
     Midpoint Circle Algorithm
-    Returns list of (x, y) pixel coordinates forming a circle centered at (xc, yc) with radius r
+    Returns (N, 2) int32 array of (x, y) pixel coordinates forming a circle centered at (xc, yc) with radius r
     """
-    points = []
-    
-    def plot_circle_points(xc, yc, x, y):
-        """Plot all 8 symmetric points of the circle"""
-        points.extend([
-            (xc + x, yc + y), (xc - x, yc + y),
-            (xc + x, yc - y), (xc - x, yc - y),
-            (xc + y, yc + x), (xc - y, yc + x),
-            (xc + y, yc - x), (xc - y, yc - x)
-        ])
-    
-    x = 0
-    y = r
-    p = 1 - r  # Initial decision parameter
-    
-    plot_circle_points(xc, yc, x, y)
-    
-    while x < y:
-        x += 1
-        if p < 0:
-            p += 2 * x + 1
-        else:
-            y -= 1
-            p += 2 * (x - y) + 1
-        plot_circle_points(xc, yc, x, y)
-    
-    return points
+    # At most r + 1 steps, 8 symmetric points each
+    out = np.empty((8 * (abs(r) + 1), 2), dtype=np.int32)
+    n = _midpoint_circle(xc, yc, r, out)
+    return out[:n]
+
 
+def _isqrt(values: np.ndarray) -> np.ndarray:
+    """Exact element-wise floor(sqrt(v)) for non-negative int64 values"""
+    root = np.sqrt(values).astype(np.int64)
+    # Correct the float estimate by at most one in either direction
+    root -= root * root > values
+    root += (root + 1) * (root + 1) <= values
+    return root
 
-def filled_circle(xc: int, yc: int, r: int) -> List[Tuple[int, int]]:
+
+def _span_offsets(half_widths: np.ndarray, dys: np.ndarray) -> np.ndarray:
     """
-    Filled circle using midpoint algorithm with horizontal line filling
+    Pixels of the horizontal spans [-h, h] on each row dy, built without Python loops
+    Returns (N, 2) int32 array of (x, y) offsets
     """
-    points = []
-    
-    def draw_horizontal_line(x1, x2, y):
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            points.append((x, y))
-    
-    x = 0
-    y = r
-    p = 1 - r
-    
-    while x <= y:
-        draw_horizontal_line(xc - x, xc + x, yc + y)
-        draw_horizontal_line(xc - x, xc + x, yc - y)
-        draw_horizontal_line(xc - y, xc + y, yc + x)
-        draw_horizontal_line(xc - y, xc + y, yc - x)
-        
-        x += 1
-        if p < 0:
-            p += 2 * x + 1
-        else:
-            y -= 1
-            p += 2 * (x - y) + 1
-    
-    return list(set(points))  # Remove duplicates
+    counts = 2 * half_widths + 1
+    row_start = np.repeat(np.cumsum(counts) - counts, counts)
+    offsets = np.empty((int(counts.sum()), 2), dtype=np.int32)
+    offsets[:, 0] = np.arange(len(offsets)) - row_start - np.repeat(half_widths, counts)
+    offsets[:, 1] = np.repeat(dys, counts)
+    return offsets
+
+
+@functools.lru_cache(maxsize=128)
+def _circle_template(r: int) -> np.ndarray:
+    """
+    Filled circle pixel offsets around (0, 0), rasterized once per radius
+    Integer-only: each row dy spans x in [-isqrt(r² - dy²), isqrt(r² - dy²)]
+    The cached array is shared between callers and marked read-only
+    """
+    dys = np.arange(-r, r + 1, dtype=np.int64)
+    offsets = _span_offsets(_isqrt(r * r - dys * dys), dys)
+    offsets.flags.writeable = False
+    return offsets
+
+
+def filled_circle(xc: int, yc: int, r: int) -> np.ndarray:
+    """
+    Filled circle as one horizontal span per scanline
+    Each pixel is produced once, so no duplicate removal is needed
+    Returns (N, 2) int32 array of (x, y) pixel coordinates
+    """
+    if r < 0:
+        return np.empty((0, 2), dtype=np.int32)
+    return _circle_template(r) + np.array((xc, yc), dtype=np.int32)
 
 
 # ============================================================================
 # MIDPOINT ELLIPSE ALGORITHM
 # ============================================================================
 
-def midpoint_ellipse(xc: int, yc: int, rx: int, ry: int) -> List[Tuple[int, int]]:
+def midpoint_ellipse(xc: int, yc: int, rx: int, ry: int) -> np.ndarray:
     """
     Midpoint Ellipse Algorithm
-    Returns list of (x, y) pixel coordinates forming an ellipse
+    Returns (N, 2) int32 array of (x, y) pixel coordinates forming an ellipse
     centered at (xc, yc) with semi-axes rx and ry
     """
-    points = []
-    
-    def plot_ellipse_points(xc, yc, x, y):
-        """Plot all 4 symmetric points of the ellipse"""
-        points.extend([
-            (xc + x, yc + y), (xc - x, yc + y),
-            (xc + x, yc - y), (xc - x, yc - y)
-        ])
-    
-    rx2 = rx * rx
-    ry2 = ry * ry
-    two_rx2 = 2 * rx2
-    two_ry2 = 2 * ry2
-    
-    # Region 1
-    x = 0
-    y = ry
-    px = 0
-    py = two_rx2 * y
-    
-    plot_ellipse_points(xc, yc, x, y)
-    
-    # Region 1: dy/dx > -1
-    p1 = ry2 - (rx2 * ry) + (0.25 * rx2)
-    while px < py:
-        x += 1
-        px += two_ry2
-        if p1 < 0:
-            p1 += ry2 + px
-        else:
-            y -= 1
-            py -= two_rx2
-            p1 += ry2 + px - py
-        plot_ellipse_points(xc, yc, x, y)
-    
-    # Region 2: dy/dx < -1
-    p2 = ry2 * (x + 0.5) ** 2 + rx2 * (y - 1) ** 2 - rx2 * ry2
-    while y > 0:
-        y -= 1
-        py -= two_rx2
-        if p2 > 0:
-            p2 += rx2 - py
-        else:
-            x += 1
-            px += two_ry2
-            p2 += rx2 - py + px
-        plot_ellipse_points(xc, yc, x, y)
-    
-    return points
+    # At most rx + ry + 1 steps, 4 symmetric points each
+    out = np.empty((4 * (abs(rx) + abs(ry) + 2), 2), dtype=np.int32)
+    n = _midpoint_ellipse(xc, yc, rx, ry, out)
+    return out[:n]
 
 
-def filled_ellipse(xc: int, yc: int, rx: int, ry: int) -> List[Tuple[int, int]]:
+@functools.lru_cache(maxsize=128)
+def _ellipse_template(rx: int, ry: int) -> np.ndarray:
     """
-    Filled ellipse using midpoint algorithm
+    Filled ellipse pixel offsets around (0, 0), rasterized once per (rx, ry)
+    Integer-only: each row dy spans x in ±isqrt(rx²·(ry² - dy²) // ry²)
+    The cached array is shared between callers and marked read-only
     """
-    points = []
-    
-    def draw_horizontal_line(x1, x2, y):
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            points.append((x, y))
-    
-    rx2 = rx * rx
-    ry2 = ry * ry
-    two_rx2 = 2 * rx2
-    two_ry2 = 2 * ry2
-    
-    x = 0
-    y = ry
-    px = 0
-    py = two_rx2 * y
-    
-    # Region 1
-    p1 = ry2 - (rx2 * ry) + (0.25 * rx2)
-    while px < py:
-        draw_horizontal_line(xc - x, xc + x, yc + y)
-        draw_horizontal_line(xc - x, xc + x, yc - y)
-        x += 1
-        px += two_ry2
-        if p1 < 0:
-            p1 += ry2 + px
-        else:
-            y -= 1
-            py -= two_rx2
-            p1 += ry2 + px - py
-    
-    # Region 2
-    p2 = ry2 * (x + 0.5) ** 2 + rx2 * (y - 1) ** 2 - rx2 * ry2
-    while y >= 0:
-        draw_horizontal_line(xc - x, xc + x, yc + y)
-        draw_horizontal_line(xc - x, xc + x, yc - y)
-        y -= 1
-        py -= two_rx2
-        if p2 > 0:
-            p2 += rx2 - py
-        else:
-            x += 1
-            px += two_ry2
-            p2 += rx2 - py + px
-    
-    return list(set(points))
+    dys = np.arange(-ry, ry + 1, dtype=np.int64)
+    if ry == 0:
+        half_widths = np.full(1, rx, dtype=np.int64)
+    else:
+        half_widths = _isqrt(rx * rx * (ry * ry - dys * dys) // (ry * ry))
+    offsets = _span_offsets(half_widths, dys)
+    offsets.flags.writeable = False
+    return offsets
+
+
+def filled_ellipse(xc: int, yc: int, rx: int, ry: int) -> np.ndarray:
+    """
+    Filled ellipse as one horizontal span per scanline
+    Each pixel is produced once, so no duplicate removal is needed
+    Returns (N, 2) int32 array of (x, y) pixel coordinates
+    """
+    if rx < 0 or ry < 0:
+        return np.empty((0, 2), dtype=np.int32)
+    return _ellipse_template(rx, ry) + np.array((xc, yc), dtype=np.int32)
 
 
 # ============================================================================
 # HOMOGENEOUS 2D TRANSFORMATION MATRICES (Homogeneity Factor = 1)
 # ============================================================================
 
+def _constant(matrix: np.ndarray) -> np.ndarray:
+    """Freeze a module-level matrix so shared references cannot be mutated"""
+    matrix.flags.writeable = False
+    return matrix
+
+
+# Templates copied by the factories below (a copy is cheaper than np.identity)
+_IDENTITY3 = _constant(np.eye(3))
+_AFFINE_IDENTITY = _constant(np.eye(2, 3))
+
+# Reflections never change, so reflect_* hand out these shared read-only matrices
+_REFLECT_X = _constant(np.diag([1.0, -1.0, 1.0]))
+_REFLECT_Y = _constant(np.diag([-1.0, 1.0, 1.0]))
+_REFLECT_ORIGIN = _constant(np.diag([-1.0, -1.0, 1.0]))
+
+
 class Transform2D:
     """
     2D Transformations using Homogeneous Coordinates
@@ -248,11 +177,10 @@ class Transform2D:
         | 0  1  ty |
         | 0  0  1  |
         """
-        return np.array([
-            [1, 0, tx],
-            [0, 1, ty],
-            [0, 0, 1]
-        ], dtype=float)
+        m = _IDENTITY3.copy()
+        m[0, 2] = tx
+        m[1, 2] = ty
+        return m
     
     @staticmethod
     def scaling_matrix(sx: float, sy: float) -> np.ndarray:
@@ -262,11 +190,10 @@ class Transform2D:
         | 0  sy  0 |
         | 0   0  1 |
         """
-        return np.array([
-            [sx, 0, 0],
-            [0, sy, 0],
-            [0, 0, 1]
-        ], dtype=float)
+        m = _IDENTITY3.copy()
+        m[0, 0] = sx
+        m[1, 1] = sy
+        return m
     
     @staticmethod
     def rotation_matrix(angle_degrees: float) -> np.ndarray:
@@ -276,35 +203,76 @@ class Transform2D:
         | sin(θ)   cos(θ)  0 |
         |   0        0     1 |
         """
-        theta = np.radians(angle_degrees)
-        cos_t = np.cos(theta)
-        sin_t = np.sin(theta)
-        return np.array([
-            [cos_t, -sin_t, 0],
-            [sin_t, cos_t, 0],
-            [0, 0, 1]
-        ], dtype=float)
+        # Scalar math.* is much cheaper than NumPy ufuncs for a single angle
+        theta = math.radians(angle_degrees)
+        cos_t = math.cos(theta)
+        sin_t = math.sin(theta)
+        m = _IDENTITY3.copy()
+        m[0, 0] = cos_t
+        m[0, 1] = -sin_t
+        m[1, 0] = sin_t
+        m[1, 1] = cos_t
+        return m
     
     @staticmethod
     def rotation_about_point(angle_degrees: float, px: float, py: float) -> np.ndarray:
         """
         Rotate about an arbitrary point (px, py)
-        T(-px,-py) * R(θ) * T(px,py)
+        T(px,py) * R(θ) * T(-px,-py), expanded in closed form:
+        | cos(θ)  -sin(θ)  px - px·cos(θ) + py·sin(θ) |
+        | sin(θ)   cos(θ)  py - px·sin(θ) - py·cos(θ) |
+        |   0        0                1               |
         """
-        T1 = Transform2D.translation_matrix(-px, -py)
-        R = Transform2D.rotation_matrix(angle_degrees)
-        T2 = Transform2D.translation_matrix(px, py)
-        return T2 @ R @ T1
+        theta = math.radians(angle_degrees)
+        cos_t = math.cos(theta)
+        sin_t = math.sin(theta)
+        m = _IDENTITY3.copy()
+        m[0, 0] = cos_t
+        m[0, 1] = -sin_t
+        m[0, 2] = px - px * cos_t + py * sin_t
+        m[1, 0] = sin_t
+        m[1, 1] = cos_t
+        m[1, 2] = py - px * sin_t - py * cos_t
+        return m
     
     @staticmethod
     def scaling_about_point(sx: float, sy: float, px: float, py: float) -> np.ndarray:
         """
         Scale about an arbitrary point (px, py)
+        T(px,py) * S(sx,sy) * T(-px,-py), expanded in closed form:
+        | sx  0   px·(1 - sx) |
+        | 0   sy  py·(1 - sy) |
+        | 0   0        1      |
         """
-        T1 = Transform2D.translation_matrix(-px, -py)
-        S = Transform2D.scaling_matrix(sx, sy)
-        T2 = Transform2D.translation_matrix(px, py)
-        return T2 @ S @ T1
+        m = _IDENTITY3.copy()
+        m[0, 0] = sx
+        m[0, 2] = px * (1 - sx)
+        m[1, 1] = sy
+        m[1, 2] = py * (1 - sy)
+        return m
+    
+    @staticmethod
+    def trs_matrix(tx: float, ty: float, angle_degrees: float, sx: float, sy: float,
+                   out: np.ndarray = None) -> np.ndarray:
+        """
+        Composite T(tx,ty) * R(θ) * S(sx,sy), expanded in closed form (no matmuls):
+        | sx·cos(θ)  -sy·sin(θ)  tx |
+        | sx·sin(θ)   sy·cos(θ)  ty |
+        |     0           0       1 |
+        Fills and returns out when given: either 3x3 with bottom row [0, 0, 1],
+        or a 2x3 affine matrix (only the top two rows are written)
+        """
+        theta = math.radians(angle_degrees)
+        cos_t = math.cos(theta)
+        sin_t = math.sin(theta)
+        m = _IDENTITY3.copy() if out is None else out
+        m[0, 0] = sx * cos_t
+        m[0, 1] = -sy * sin_t
+        m[0, 2] = tx
+        m[1, 0] = sx * sin_t
+        m[1, 1] = sy * cos_t
+        m[1, 2] = ty
+        return m
     
     @staticmethod
     def shear_matrix(shx: float, shy: float) -> np.ndarray:
@@ -314,42 +282,136 @@ class Transform2D:
         | shy  1   0 |
         | 0    0   1 |
         """
-        return np.array([
-            [1, shx, 0],
-            [shy, 1, 0],
-            [0, 0, 1]
-        ], dtype=float)
+        m = _IDENTITY3.copy()
+        m[0, 1] = shx
+        m[1, 0] = shy
+        return m
     
     @staticmethod
     def reflect_x() -> np.ndarray:
-        """Reflection about x-axis"""
-        return Transform2D.scaling_matrix(1, -1)
+        """Reflection about x-axis (shared read-only matrix: copy before modifying)"""
+        return _REFLECT_X
     
     @staticmethod
     def reflect_y() -> np.ndarray:
-        """Reflection about y-axis"""
-        return Transform2D.scaling_matrix(-1, 1)
+        """Reflection about y-axis (shared read-only matrix: copy before modifying)"""
+        return _REFLECT_Y
     
     @staticmethod
     def reflect_origin() -> np.ndarray:
-        """Reflection about origin"""
-        return Transform2D.scaling_matrix(-1, -1)
+        """Reflection about origin (shared read-only matrix: copy before modifying)"""
+        return _REFLECT_ORIGIN
+    
+    @staticmethod
+    def mirror_local_y(matrix: np.ndarray) -> np.ndarray:
+        """
+        matrix @ reflect_x() without the matmul: reflecting local y only flips
+        the sign of column 1. Works on 2x3 and 3x3 matrices; returns a new array
+        """
+        m = matrix.copy()
+        m[:, 1] *= -1
+        return m
+    
+    # ------------------------------------------------------------------------
+    # 2x3 affine forms: the [0, 0, 1] bottom row is implicit, so composing and
+    # applying them skips the homogeneous row and the w-divide entirely
+    # ------------------------------------------------------------------------
+    
+    @staticmethod
+    def affine_translation_matrix(tx: float, ty: float) -> np.ndarray:
+        """
+        2x3 affine translation matrix
+        | 1  0  tx |
+        | 0  1  ty |
+        """
+        m = _AFFINE_IDENTITY.copy()
+        m[0, 2] = tx
+        m[1, 2] = ty
+        return m
     
     @staticmethod
-    def transform_point(point: Tuple[float, float], matrix: np.ndarray) -> Tuple[float, float]:
+    def affine_scaling_matrix(sx: float, sy: float) -> np.ndarray:
         """
-        Transform a 2D point using homogeneous matrix
+        2x3 affine scaling matrix
+        | sx  0  0 |
+        | 0  sy  0 |
         """
-        p = np.array([point[0], point[1], 1])
-        result = matrix @ p
-        return (result[0] / result[2], result[1] / result[2])
+        m = _AFFINE_IDENTITY.copy()
+        m[0, 0] = sx
+        m[1, 1] = sy
+        return m
     
     @staticmethod
-    def transform_points(points: List[Tuple[float, float]], matrix: np.ndarray) -> List[Tuple[float, float]]:
+    def affine_rotation_matrix(angle_degrees: float) -> np.ndarray:
         """
-        Transform multiple 2D points using homogeneous matrix
+        2x3 affine rotation matrix (counter-clockwise)
+        | cos(θ)  -sin(θ)  0 |
+        | sin(θ)   cos(θ)  0 |
         """
-        return [Transform2D.transform_point(p, matrix) for p in points]
+        return Transform2D.affine_rotation_about_point(angle_degrees, 0, 0)
+    
+    @staticmethod
+    def affine_rotation_about_point(angle_degrees: float, px: float, py: float) -> np.ndarray:
+        """2x3 affine form of rotation_about_point"""
+        theta = math.radians(angle_degrees)
+        cos_t = math.cos(theta)
+        sin_t = math.sin(theta)
+        m = np.empty((2, 3))
+        m[0, 0] = cos_t
+        m[0, 1] = -sin_t
+        m[0, 2] = px - px * cos_t + py * sin_t
+        m[1, 0] = sin_t
+        m[1, 1] = cos_t
+        m[1, 2] = py - px * sin_t - py * cos_t
+        return m
+    
+    @staticmethod
+    def affine_scaling_about_point(sx: float, sy: float, px: float, py: float) -> np.ndarray:
+        """2x3 affine form of scaling_about_point"""
+        m = _AFFINE_IDENTITY.copy()
+        m[0, 0] = sx
+        m[0, 2] = px * (1 - sx)
+        m[1, 1] = sy
+        m[1, 2] = py * (1 - sy)
+        return m
+    
+    @staticmethod
+    def affine_trs_matrix(tx: float, ty: float, angle_degrees: float, sx: float, sy: float,
+                          out: np.ndarray = None) -> np.ndarray:
+        """2x3 affine form of trs_matrix"""
+        if out is None:
+            out = np.empty((2, 3))
+        return Transform2D.trs_matrix(tx, ty, angle_degrees, sx, sy, out=out)
+    
+    @staticmethod
+    def transform_point(point: Tuple[float, float], matrix: np.ndarray,
+                        projection: bool = False) -> Tuple[float, float]:
+        """
+        Transform a 2D point using a 2x3 affine or 3x3 homogeneous matrix
+        Affine matrices have bottom row [0, 0, 1] (w = 1), so unless projection
+        is requested (3x3 only) the point is mapped with 4 multiplies and 4 adds
+        """
+        x, y = point[0], point[1]
+        tx = matrix[0, 0] * x + matrix[0, 1] * y + matrix[0, 2]
+        ty = matrix[1, 0] * x + matrix[1, 1] * y + matrix[1, 2]
+        if projection:
+            w = matrix[2, 0] * x + matrix[2, 1] * y + matrix[2, 2]
+            return (tx / w, ty / w)
+        return (tx, ty)
+    
+    @staticmethod
+    def transform_points(points, matrix: np.ndarray, projection: bool = False) -> np.ndarray:
+        """
+        Transform multiple 2D points using a 2x3 affine or 3x3 homogeneous matrix
+        All points are mapped in one batched matmul; returns an (N, 2) float64 array
+        projection applies the w-divide and needs the full 3x3 matrix
+        """
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        out = pts @ matrix[:2, :2].T + matrix[:2, 2]
+        if projection:
+            w = pts @ matrix[2, :2] + matrix[2, 2]
+            out /= w[:, None]
+        return out
 
 
 # ============================================================================
@@ -377,73 +439,28 @@ class CohenSutherland:
     
     def compute_code(self, x: float, y: float) -> int:
         """Compute the region code for a point"""
-        code = self.INSIDE
-        
-        if x < self.x_min:
-            code |= self.LEFT
-        elif x > self.x_max:
-            code |= self.RIGHT
-        
-        if y < self.y_min:
-            code |= self.BOTTOM
-        elif y > self.y_max:
-            code |= self.TOP
-        
-        return code
+        return _cs_code(x, y, self.x_min, self.y_min, self.x_max, self.y_max)
     
     def clip_line(self, x1: float, y1: float, x2: float, y2: float) -> Tuple[bool, Tuple[float, float, float, float]]:
         """
         Clip a line segment against the clipping window
         Returns: (accepted, (x1, y1, x2, y2))
         """
-        code1 = self.compute_code(x1, y1)
-        code2 = self.compute_code(x2, y2)
-        
-        while True:
-            if (code1 | code2) == 0:
-                # Both points inside - trivially accept
-                return True, (x1, y1, x2, y2)
-            
-            elif (code1 & code2) != 0:
-                # Both points share an outside region - trivially reject
-                return False, (0, 0, 0, 0)
-            
-            else:
-                # Line needs clipping
-                # Pick an outside point
-                code_out = code1 if code1 != 0 else code2
-                
-                # Find intersection point
-                if code_out & self.TOP:
-                    x = x1 + (x2 - x1) * (self.y_max - y1) / (y2 - y1)
-                    y = self.y_max
-                elif code_out & self.BOTTOM:
-                    x = x1 + (x2 - x1) * (self.y_min - y1) / (y2 - y1)
-                    y = self.y_min
-                elif code_out & self.RIGHT:
-                    y = y1 + (y2 - y1) * (self.x_max - x1) / (x2 - x1)
-                    x = self.x_max
-                elif code_out & self.LEFT:
-                    y = y1 + (y2 - y1) * (self.x_min - x1) / (x2 - x1)
-                    x = self.x_min
-                
-                # Replace outside point with intersection point
-                if code_out == code1:
-                    x1, y1 = x, y
-                    code1 = self.compute_code(x1, y1)
-                else:
-                    x2, y2 = x, y
-                    code2 = self.compute_code(x2, y2)
+        accepted, x1, y1, x2, y2 = _cs_clip(x1, y1, x2, y2,
+                                            self.x_min, self.y_min, self.x_max, self.y_max)
+        return accepted, (x1, y1, x2, y2)
 
 
 # ============================================================================
-# SUTHERLAND-HODGMAN POLYGON CLIPPING ALGORITHM
+# LIANG-BARSKY LINE CLIPPING ALGORITHM
 # ============================================================================
 
-class SutherlandHodgman:
+class LiangBarsky:
     """
-    Sutherland-Hodgman Polygon Clipping Algorithm
-    Clips polygons against a rectangular clipping window
+    Liang-Barsky Parametric Line Clipping Algorithm
+    Clips lines against a rectangular clipping window
+    Solves for the entering/exiting parameters t0, t1 of P(t) = P1 + t(P2 - P1)
+    in a single pass over the 4 window edges, with no region-code iteration
     """
     
     def __init__(self, x_min: float, y_min: float, x_max: float, y_max: float):
@@ -452,79 +469,100 @@ class SutherlandHodgman:
         self.x_max = x_max
         self.y_max = y_max
     
-    def _clip_edge(self, polygon: List[Tuple[float, float]], 
-                   edge_start: Tuple[float, float], 
-                   edge_end: Tuple[float, float]) -> List[Tuple[float, float]]:
-        """Clip polygon against a single edge"""
+    def clip_line(self, x1: float, y1: float, x2: float, y2: float) -> Tuple[bool, Tuple[float, float, float, float]]:
+        """
+        Clip a line segment against the clipping window
+        Returns: (accepted, (x1, y1, x2, y2))
+        """
+        x_min, y_min, x_max, y_max = self.x_min, self.y_min, self.x_max, self.y_max
         
-        def inside(p):
-            """Check if point is inside the edge (left side)"""
-            return ((edge_end[0] - edge_start[0]) * (p[1] - edge_start[1]) - 
-                    (edge_end[1] - edge_start[1]) * (p[0] - edge_start[0])) >= 0
+        # Both endpoints inside - trivially accept
+        if (x_min <= x1 <= x_max and x_min <= x2 <= x_max and
+                y_min <= y1 <= y_max and y_min <= y2 <= y_max):
+            return True, (x1, y1, x2, y2)
         
-        def intersection(p1, p2):
-            """Find intersection of line p1-p2 with edge"""
-            x1, y1 = p1
-            x2, y2 = p2
-            x3, y3 = edge_start
-            x4, y4 = edge_end
-            
-            denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
-            if abs(denom) < 1e-10:
-                return p1
-            
-            t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denom
-            
-            x = x1 + t * (x2 - x1)
-            y = y1 + t * (y2 - y1)
-            return (x, y)
+        dx = x2 - x1
+        dy = y2 - y1
+        t0 = 0.0
+        t1 = 1.0
         
-        if len(polygon) == 0:
-            return []
+        # x edges: p = -dx (left) / dx (right); a zero p means the line is vertical
+        if dx == 0:
+            if x1 < x_min or x1 > x_max:
+                return False, (0, 0, 0, 0)
+        else:
+            # Moving right, the line enters through the left edge; otherwise swap
+            t_enter = (x_min - x1) / dx
+            t_exit = (x_max - x1) / dx
+            if dx < 0:
+                t_enter, t_exit = t_exit, t_enter
+            if t_enter > t0:
+                t0 = t_enter
+            if t_exit < t1:
+                t1 = t_exit
         
-        output = []
+        # y edges: p = -dy (bottom) / dy (top); a zero p means the line is horizontal
+        if dy == 0:
+            if y1 < y_min or y1 > y_max:
+                return False, (0, 0, 0, 0)
+        else:
+            # Moving up, the line enters through the bottom edge; otherwise swap
+            t_enter = (y_min - y1) / dy
+            t_exit = (y_max - y1) / dy
+            if dy < 0:
+                t_enter, t_exit = t_exit, t_enter
+            if t_enter > t0:
+                t0 = t_enter
+            if t_exit < t1:
+                t1 = t_exit
         
-        for i in range(len(polygon)):
-            current = polygon[i]
-            next_vertex = polygon[(i + 1) % len(polygon)]
-            
-            current_inside = inside(current)
-            next_inside = inside(next_vertex)
-            
-            if current_inside:
-                if next_inside:
-                    # Both inside - add next
-                    output.append(next_vertex)
-                else:
-                    # Current inside, next outside - add intersection
-                    output.append(intersection(current, next_vertex))
-            else:
-                if next_inside:
-                    # Current outside, next inside - add intersection and next
-                    output.append(intersection(current, next_vertex))
-                    output.append(next_vertex)
-                # Both outside - add nothing
+        # The entering parameter passed the exiting one: line misses the window
+        if t0 > t1:
+            return False, (0, 0, 0, 0)
         
-        return output
+        return True, (x1 + t0 * dx, y1 + t0 * dy, x1 + t1 * dx, y1 + t1 * dy)
+
+
+# ============================================================================
+# SUTHERLAND-HODGMAN POLYGON CLIPPING ALGORITHM
+# ============================================================================
+
+class SutherlandHodgman:
+    """
+    Sutherland-Hodgman Polygon Clipping Algorithm
+    Clips polygons against a rectangular clipping window
+    """
     
-    def clip_polygon(self, polygon: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    def __init__(self, x_min: float, y_min: float, x_max: float, y_max: float):
+        self.x_min = x_min
+        self.y_min = y_min
+        self.x_max = x_max
+        self.y_max = y_max
+    
+    def clip_polygon(self, polygon) -> np.ndarray:
         """
         Clip polygon against all four edges of the clipping window
+        Accepts a list of (x, y) points or an (N, 2) array; returns an (N, 2) float64 array
+        The four edge passes are skipped when the bounding box already decides
         """
-        # Define the four edges of the clipping window (counter-clockwise)
-        edges = [
-            ((self.x_min, self.y_min), (self.x_max, self.y_min)),  # Bottom
-            ((self.x_max, self.y_min), (self.x_max, self.y_max)),  # Right
-            ((self.x_max, self.y_max), (self.x_min, self.y_max)),  # Top
-            ((self.x_min, self.y_max), (self.x_min, self.y_min)),  # Left
-        ]
+        output = np.ascontiguousarray(polygon, dtype=np.float64).reshape(-1, 2)
+        if len(output) == 0:
+            return output
         
-        output = polygon[:]
+        # Trivial accept/reject: boundary points count as inside, matching the edge passes
+        bx_min, by_min = output.min(axis=0)
+        bx_max, by_max = output.max(axis=0)
+        if (bx_min >= self.x_min and bx_max <= self.x_max
+                and by_min >= self.y_min and by_max <= self.y_max):
+            return output
+        if (bx_max < self.x_min or bx_min > self.x_max
+                or by_max < self.y_min or by_min > self.y_max):
+            return output[:0]
         
-        for edge_start, edge_end in edges:
-            if len(output) == 0:
-                break
-            output = self._clip_edge(output, edge_start, edge_end)
+        # Bottom, right, top, left (counter-clockwise around the window), fused
+        # into one compiled call instead of one dispatch per edge
+        output = _sh_clip_rect(output, float(self.x_min), float(self.y_min),
+                               float(self.x_max), float(self.y_max))
         
         return output
 
@@ -533,54 +571,56 @@ class SutherlandHodgman:
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def polygon_from_lines(vertices: List[Tuple[float, float]]) -> List[Tuple[int, int]]:
+def polygon_outline(vertices) -> np.ndarray:
+    """
+    Outline pixels of a closed polygon, one Bresenham pass per edge
+    Vertices are truncated to integers; returns an (N, 2) int32 array
+    """
+    # The kernels are compiled for C-contiguous int32 input only
+    verts = np.ascontiguousarray(vertices, dtype=np.int32).reshape(-1, 2)
+    if len(verts) == 0:
+        return np.empty((0, 2), dtype=np.int32)
+    return _polygon_outline(verts)
+
+
+def polyline(vertices) -> np.ndarray:
+    """
+    Pixels of an open polyline, one Bresenham pass per consecutive vertex pair
+    Vertices are truncated to integers; returns an (N, 2) int32 array
+    """
+    # The kernels are compiled for C-contiguous int32 input only
+    verts = np.ascontiguousarray(vertices, dtype=np.int32).reshape(-1, 2)
+    if len(verts) < 2:
+        return np.empty((0, 2), dtype=np.int32)
+    return _polyline(verts)
+
+
+def polygon_from_lines(vertices: List[Tuple[float, float]]) -> np.ndarray:
     """
     Generate all pixel points for a polygon using Bresenham's line algorithm
     """
-    points = []
-    n = len(vertices)
-    for i in range(n):
-        x1, y1 = int(vertices[i][0]), int(vertices[i][1])
-        x2, y2 = int(vertices[(i + 1) % n][0]), int(vertices[(i + 1) % n][1])
-        points.extend(bresenham_line(x1, y1, x2, y2))
-    return points
+    return polygon_outline(vertices)
 
 
-def filled_polygon(vertices: List[Tuple[float, float]]) -> List[Tuple[int, int]]:
+def filled_polygon(vertices) -> np.ndarray:
     """
     Fill a polygon using scanline algorithm
+    Returns (N, 2) int32 array of (x, y) pixel coordinates, row by row
     """
-    if len(vertices) < 3:
-        return []
-    
-    points = []
-    
-    # Find bounding box
-    min_y = int(min(v[1] for v in vertices))
-    max_y = int(max(v[1] for v in vertices))
-    
-    # Scanline fill
-    for y in range(min_y, max_y + 1):
-        intersections = []
-        n = len(vertices)
-        
-        for i in range(n):
-            x1, y1 = vertices[i]
-            x2, y2 = vertices[(i + 1) % n]
-            
-            if y1 == y2:
-                continue
-            
-            if min(y1, y2) <= y < max(y1, y2):
-                x = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
-                intersections.append(x)
-        
-        intersections.sort()
-        
-        for i in range(0, len(intersections) - 1, 2):
-            x_start = int(intersections[i])
-            x_end = int(intersections[i + 1])
-            for x in range(x_start, x_end + 1):
-                points.append((x, y))
-    
-    return points
+    verts = np.ascontiguousarray(vertices, dtype=np.float64).reshape(-1, 2)
+    if len(verts) < 3:
+        return np.empty((0, 2), dtype=np.int32)
+    return _filled_polygon(verts)
+
+
+def filled_convex_polygon(vertices) -> np.ndarray:
+    """
+    Fill a convex polygon using scanline algorithm
+    Each scanline's span comes straight from the polygon's two crossing edges,
+    with no per-scanline sort; same pixels as filled_polygon for convex input
+    Returns (N, 2) int32 array of (x, y) pixel coordinates, row by row
+    """
+    verts = np.ascontiguousarray(vertices, dtype=np.float64).reshape(-1, 2)
+    if len(verts) < 3:
+        return np.empty((0, 2), dtype=np.int32)
+    return _filled_convex_polygon(verts)
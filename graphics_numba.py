@@ -0,0 +1,582 @@
+"""
+Numba Kernels Module
+JIT-compiled rasterization kernels used by graphics_algorithms
+Falls back to plain Python when Numba is not installed
+"""
+
+import math
+import warnings
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    warnings.warn("Numba is not installed; rasterization kernels run as plain Python "
+                  "(pip install numba for full speed)", RuntimeWarning)
+
+    def njit(*args, **kwargs):
+        """Pure-Python stand-in for numba.njit (decorator with or without arguments)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# ============================================================================
+# BRESENHAM'S LINE DRAWING KERNEL
+# ============================================================================
+
+@njit('int32[:,:](int32,int32,int32,int32,int32[:,:])', cache=True, fastmath=False)
+def _bresenham(x1, y1, x2, y2, out):
+    """
+    Bresenham's Line Drawing kernel
+    Writes the max(|dx|, |dy|) + 1 pixels of the line into out[i, 0], out[i, 1]
+    The decision step is branchless: the minor-axis step and the error update
+    are scaled by step = (p >= 0), which LLVM lowers to a select instead of a jump
+    """
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+
+    x, y = x1, y1
+
+    sx = 1 if x2 > x1 else -1
+    sy = 1 if y2 > y1 else -1
+
+    if dx > dy:
+        # Slope < 1
+        two_dx = 2 * dx
+        two_dy = 2 * dy
+        p = two_dy - dx
+        for i in range(dx + 1):
+            out[i, 0] = x
+            out[i, 1] = y
+            step = int(p >= 0)
+            y += sy * step
+            p += two_dy - two_dx * step
+            x += sx
+    else:
+        # Slope >= 1
+        two_dx = 2 * dx
+        two_dy = 2 * dy
+        p = two_dx - dy
+        for i in range(dy + 1):
+            out[i, 0] = x
+            out[i, 1] = y
+            step = int(p >= 0)
+            x += sx * step
+            p += two_dx - two_dy * step
+            y += sy
+
+    return out
+
+
+@njit('int32[:,:](int32[:,::1],intp)', cache=True)
+def _walk_edges(verts, n_edges):
+    """
+    Edge-walking kernel shared by polylines and polygon outlines
+    Rasterizes edges i -> (i + 1) % N for i < n_edges with Bresenham's algorithm,
+    writing all edge pixels into a single preallocated array
+    """
+    n = verts.shape[0]
+
+    # First pass: exact pixel count of every edge
+    total = 0
+    for i in range(n_edges):
+        j = (i + 1) % n
+        total += max(abs(verts[j, 0] - verts[i, 0]), abs(verts[j, 1] - verts[i, 1])) + 1
+
+    out = np.empty((total, 2), dtype=np.int32)
+
+    # Second pass: rasterize each edge into its slice
+    start = 0
+    for i in range(n_edges):
+        j = (i + 1) % n
+        count = max(abs(verts[j, 0] - verts[i, 0]), abs(verts[j, 1] - verts[i, 1])) + 1
+        _bresenham(verts[i, 0], verts[i, 1], verts[j, 0], verts[j, 1], out[start:start + count])
+        start += count
+
+    return out
+
+
+@njit('int32[:,:](int32[:,::1])', cache=True)
+def _polygon_outline(verts):
+    """Closed polygon outline kernel for a C-contiguous (N, 2) int32 vertex array"""
+    return _walk_edges(verts, verts.shape[0])
+
+
+@njit('int32[:,:](int32[:,::1])', cache=True)
+def _polyline(verts):
+    """Open polyline kernel for a C-contiguous (N, 2) int32 vertex array (no closing edge)"""
+    return _walk_edges(verts, verts.shape[0] - 1)
+
+
+@njit('int32[:,:](int32[:,::1])', cache=True)
+def _line_segments(segments):
+    """
+    Independent-lines kernel for a C-contiguous (M, 4) int32 array of (x1, y1, x2, y2)
+    Same two passes as _walk_edges: count every line's pixels, then rasterize
+    each line into its slice of one preallocated array
+    """
+    total = 0
+    for i in range(segments.shape[0]):
+        total += max(abs(segments[i, 2] - segments[i, 0]), abs(segments[i, 3] - segments[i, 1])) + 1
+
+    out = np.empty((total, 2), dtype=np.int32)
+
+    start = 0
+    for i in range(segments.shape[0]):
+        x1, y1, x2, y2 = segments[i, 0], segments[i, 1], segments[i, 2], segments[i, 3]
+        count = max(abs(x2 - x1), abs(y2 - y1)) + 1
+        _bresenham(x1, y1, x2, y2, out[start:start + count])
+        start += count
+
+    return out
+
+
+# ============================================================================
+# SCANLINE POLYGON FILL KERNEL
+# ============================================================================
+
+@njit('int32[:,:](float64[:,::1])', cache=True)
+def _filled_polygon(verts):
+    """
+    Scanline polygon fill kernel for a C-contiguous (N, 2) float64 vertex array
+    Uses an Active Edge Table: edges are bucketed by their first scanline and only
+    the edges spanning the current scanline are intersected, instead of all N
+    The first pass records every span as (x_start, x_end, y), the second pass
+    writes the spans' pixels into one exactly-sized int32 array
+    """
+    n = verts.shape[0]
+    min_y = int(verts[:, 1].min())
+    max_y = int(verts[:, 1].max())
+
+    # Edge table of the non-horizontal edges, one SoA entry per edge;
+    # an edge covers scanlines y with min(y1, y2) <= y < max(y1, y2)
+    edge_x1 = np.empty(n, dtype=np.float64)
+    edge_y1 = np.empty(n, dtype=np.float64)
+    edge_dx = np.empty(n, dtype=np.float64)
+    edge_dy = np.empty(n, dtype=np.float64)
+    edge_start = np.empty(n, dtype=np.int64)
+    edge_end = np.empty(n, dtype=np.int64)
+    m = 0
+    for i in range(n):
+        j = i + 1 if i + 1 < n else 0
+        y1, y2 = verts[i, 1], verts[j, 1]
+        if y1 == y2:
+            continue
+        edge_x1[m] = verts[i, 0]
+        edge_y1[m] = y1
+        edge_dx[m] = verts[j, 0] - verts[i, 0]
+        edge_dy[m] = y2 - y1
+        edge_start[m] = math.ceil(min(y1, y2))
+        edge_end[m] = math.ceil(max(y1, y2))  # exclusive
+        m += 1
+
+    # Bucket the edges by first scanline (counting sort into CSR form): the edges
+    # starting on scanline y are bucket_edges[bucket_start[r]:bucket_start[r + 1]]
+    # with r = y - min_y. Edges starting above max_y never become active
+    rows = max_y - min_y + 1
+    bucket_start = np.zeros(rows + 1, dtype=np.int64)
+    for e in range(m):
+        if edge_start[e] <= max_y:
+            bucket_start[edge_start[e] - min_y + 1] += 1
+    for r in range(rows):
+        bucket_start[r + 1] += bucket_start[r]
+    bucket_edges = np.empty(bucket_start[rows], dtype=np.int64)
+    cursor = bucket_start[:rows].copy()
+    for e in range(m):
+        if edge_start[e] <= max_y:
+            r = edge_start[e] - min_y
+            bucket_edges[cursor[r]] = e
+            cursor[r] += 1
+
+    active = np.empty(m, dtype=np.int64)
+    n_active = 0
+
+    xs = np.empty(n, dtype=np.float64)
+    spans = np.empty((rows * (n // 2), 3), dtype=np.int64)
+    n_spans = 0
+    total = 0
+
+    for y in range(min_y, max_y + 1):
+        # Drop edges that ended below this scanline, then add the ones starting here
+        k = 0
+        for a in range(n_active):
+            if edge_end[active[a]] > y:
+                active[k] = active[a]
+                k += 1
+        n_active = k
+        r = y - min_y
+        for b in range(bucket_start[r], bucket_start[r + 1]):
+            e = bucket_edges[b]
+            if edge_end[e] > y:
+                active[n_active] = e
+                n_active += 1
+
+        # Intersections with the active edges (same formula as a full edge scan),
+        # insertion-sorted since only a handful of edges are active at once
+        for a in range(n_active):
+            e = active[a]
+            x = edge_x1[e] + (y - edge_y1[e]) * edge_dx[e] / edge_dy[e]
+            b = a
+            while b > 0 and xs[b - 1] > x:
+                xs[b] = xs[b - 1]
+                b -= 1
+            xs[b] = x
+
+        for a in range(0, n_active - 1, 2):
+            x_start = int(xs[a])
+            x_end = int(xs[a + 1])
+            if x_end >= x_start:
+                spans[n_spans, 0] = x_start
+                spans[n_spans, 1] = x_end
+                spans[n_spans, 2] = y
+                n_spans += 1
+                total += x_end - x_start + 1
+
+    out = np.empty((total, 2), dtype=np.int32)
+    i = 0
+    for s in range(n_spans):
+        y = spans[s, 2]
+        for x in range(spans[s, 0], spans[s, 1] + 1):
+            out[i, 0] = x
+            out[i, 1] = y
+            i += 1
+
+    return out
+
+
+@njit('int32[:,:](float64[:,::1])', cache=True)
+def _filled_convex_polygon(verts):
+    """
+    Scanline fill kernel specialized for convex polygons
+    Every scanline of a convex polygon crosses exactly two edges, so each edge
+    writes its intersections straight into per-row left/right slots: no edge
+    table and no sorting. Spans are identical to _filled_polygon's for convex input
+    """
+    n = verts.shape[0]
+    min_y = int(verts[:, 1].min())
+    max_y = int(verts[:, 1].max())
+    rows = max_y - min_y + 1
+
+    # The two crossings of every scanline (in edge order) and how many were seen
+    x_a = np.empty(rows, dtype=np.float64)
+    x_b = np.empty(rows, dtype=np.float64)
+    hits = np.zeros(rows, dtype=np.int64)
+
+    for i in range(n):
+        j = i + 1 if i + 1 < n else 0
+        x1, y1 = verts[i, 0], verts[i, 1]
+        x2, y2 = verts[j, 0], verts[j, 1]
+
+        if y1 == y2:
+            continue
+
+        # Scanlines y with min(y1, y2) <= y < max(y1, y2)
+        start = max(math.ceil(min(y1, y2)), min_y)
+        end = min(math.ceil(max(y1, y2)), max_y + 1)
+        for y in range(start, end):
+            x = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+            r = y - min_y
+            if hits[r] == 0:
+                x_a[r] = x
+            else:
+                x_b[r] = x
+            hits[r] += 1
+
+    total = 0
+    for r in range(rows):
+        if hits[r] >= 2:
+            x_start = int(min(x_a[r], x_b[r]))
+            x_end = int(max(x_a[r], x_b[r]))
+            if x_end >= x_start:
+                total += x_end - x_start + 1
+
+    out = np.empty((total, 2), dtype=np.int32)
+    i = 0
+    for r in range(rows):
+        if hits[r] >= 2:
+            x_start = int(min(x_a[r], x_b[r]))
+            x_end = int(max(x_a[r], x_b[r]))
+            for x in range(x_start, x_end + 1):
+                out[i, 0] = x
+                out[i, 1] = min_y + r
+                i += 1
+
+    return out
+
+
+# ============================================================================
+# MIDPOINT CIRCLE / ELLIPSE KERNELS (outline, symmetric points inlined)
+# ============================================================================
+
+@njit('intp(int32,int32,int32,int32[:,:])', cache=True)
+def _midpoint_circle(xc, yc, r, out):
+    """
+    Midpoint Circle kernel
+    Writes the 8 symmetric points of every step into out[8*i : 8*i + 8]
+    Returns the number of rows of out that were filled
+    """
+    x = 0
+    y = r
+    p = 1 - r  # Initial decision parameter
+
+    i = 0
+    while True:
+        # 8-way symmetry
+        out[i, 0] = xc + x
+        out[i, 1] = yc + y
+        out[i + 1, 0] = xc - x
+        out[i + 1, 1] = yc + y
+        out[i + 2, 0] = xc + x
+        out[i + 2, 1] = yc - y
+        out[i + 3, 0] = xc - x
+        out[i + 3, 1] = yc - y
+        out[i + 4, 0] = xc + y
+        out[i + 4, 1] = yc + x
+        out[i + 5, 0] = xc - y
+        out[i + 5, 1] = yc + x
+        out[i + 6, 0] = xc + y
+        out[i + 6, 1] = yc - x
+        out[i + 7, 0] = xc - y
+        out[i + 7, 1] = yc - x
+        i += 8
+
+        if x >= y:
+            break
+        x += 1
+        if p < 0:
+            p += 2 * x + 1
+        else:
+            y -= 1
+            p += 2 * (x - y) + 1
+
+    return i
+
+
+@njit('intp(int32,int32,int32,int32,int32[:,:])', cache=True)
+def _midpoint_ellipse(xc, yc, rx, ry, out):
+    """
+    Midpoint Ellipse kernel
+    Writes the 4 symmetric points of every step into out[4*i : 4*i + 4]
+    Returns the number of rows of out that were filled
+    Decision parameters are kept at 4x scale so the loop stays integer-only
+    """
+    rx2 = rx * rx
+    ry2 = ry * ry
+    two_rx2 = 2 * rx2
+    two_ry2 = 2 * ry2
+
+    # Region 1
+    x = 0
+    y = ry
+    px = 0
+    py = two_rx2 * y
+
+    i = 0
+    # 4-way symmetry
+    out[i, 0] = xc + x
+    out[i, 1] = yc + y
+    out[i + 1, 0] = xc - x
+    out[i + 1, 1] = yc + y
+    out[i + 2, 0] = xc + x
+    out[i + 2, 1] = yc - y
+    out[i + 3, 0] = xc - x
+    out[i + 3, 1] = yc - y
+    i += 4
+
+    # Region 1: dy/dx > -1
+    p1 = 4 * ry2 - 4 * rx2 * ry + rx2
+    while px < py:
+        x += 1
+        px += two_ry2
+        if p1 < 0:
+            p1 += 4 * (ry2 + px)
+        else:
+            y -= 1
+            py -= two_rx2
+            p1 += 4 * (ry2 + px - py)
+        out[i, 0] = xc + x
+        out[i, 1] = yc + y
+        out[i + 1, 0] = xc - x
+        out[i + 1, 1] = yc + y
+        out[i + 2, 0] = xc + x
+        out[i + 2, 1] = yc - y
+        out[i + 3, 0] = xc - x
+        out[i + 3, 1] = yc - y
+        i += 4
+
+    # Region 2: dy/dx < -1
+    p2 = ry2 * (2 * x + 1) ** 2 + 4 * rx2 * (y - 1) ** 2 - 4 * rx2 * ry2
+    while y > 0:
+        y -= 1
+        py -= two_rx2
+        if p2 > 0:
+            p2 += 4 * (rx2 - py)
+        else:
+            x += 1
+            px += two_ry2
+            p2 += 4 * (rx2 - py + px)
+        out[i, 0] = xc + x
+        out[i, 1] = yc + y
+        out[i + 1, 0] = xc - x
+        out[i + 1, 1] = yc + y
+        out[i + 2, 0] = xc + x
+        out[i + 2, 1] = yc - y
+        out[i + 3, 0] = xc - x
+        out[i + 3, 1] = yc - y
+        i += 4
+
+    return i
+
+
+# ============================================================================
+# COHEN-SUTHERLAND LINE CLIPPING KERNELS
+# ============================================================================
+
+# Region codes (same values as CohenSutherland)
+_CS_LEFT = 1
+_CS_RIGHT = 2
+_CS_BOTTOM = 4
+_CS_TOP = 8
+
+
+@njit('intp(float64,float64,float64,float64,float64,float64)', cache=True)
+def _cs_code(x, y, x_min, y_min, x_max, y_max):
+    """
+    Region code of a point against the clipping window
+    Branchless: each comparison result is shifted into its bit and or-ed together
+    """
+    return ((x < x_min) << 0) | ((x > x_max) << 1) | ((y < y_min) << 2) | ((y > y_max) << 3)
+
+
+@njit('Tuple((boolean,float64,float64,float64,float64))'
+      '(float64,float64,float64,float64,float64,float64,float64,float64)', cache=True)
+def _cs_clip(x1, y1, x2, y2, x_min, y_min, x_max, y_max):
+    """
+    Cohen-Sutherland kernel for one line segment
+    Returns (accepted, x1, y1, x2, y2); rejected lines come back as zeros
+    """
+    code1 = _cs_code(x1, y1, x_min, y_min, x_max, y_max)
+    code2 = _cs_code(x2, y2, x_min, y_min, x_max, y_max)
+
+    while True:
+        if (code1 | code2) == 0:
+            # Both points inside - trivially accept
+            return True, x1, y1, x2, y2
+
+        if (code1 & code2) != 0:
+            # Both points share an outside region - trivially reject
+            return False, 0.0, 0.0, 0.0, 0.0
+
+        # Pick an outside point and intersect with its first violated edge
+        code_out = code1 if code1 != 0 else code2
+
+        if code_out & _CS_TOP:
+            x = x1 + (x2 - x1) * (y_max - y1) / (y2 - y1)
+            y = y_max
+        elif code_out & _CS_BOTTOM:
+            x = x1 + (x2 - x1) * (y_min - y1) / (y2 - y1)
+            y = y_min
+        elif code_out & _CS_RIGHT:
+            y = y1 + (y2 - y1) * (x_max - x1) / (x2 - x1)
+            x = x_max
+        else:
+            y = y1 + (y2 - y1) * (x_min - x1) / (x2 - x1)
+            x = x_min
+
+        # Replace outside point with intersection point
+        if code_out == code1:
+            x1, y1 = x, y
+            code1 = _cs_code(x1, y1, x_min, y_min, x_max, y_max)
+        else:
+            x2, y2 = x, y
+            code2 = _cs_code(x2, y2, x_min, y_min, x_max, y_max)
+
+
+# ============================================================================
+# SUTHERLAND-HODGMAN POLYGON CLIPPING KERNEL
+# ============================================================================
+
+@njit('float64[:,::1](float64[:,::1],intp,float64,float64)', cache=True)
+def _sh_clip_axis(poly, axis, bound, side):
+    """
+    Clip an (N, 2) float64 polygon against the axis-aligned line p[axis] = bound
+    Points with side * (p[axis] - bound) >= 0 are inside (side is +1 or -1)
+    A crossing segment never has a zero denominator, and the intersection is one
+    interpolation along the other axis; returns the clipped polygon
+    (at most 2N points, since each vertex pair emits up to two)
+    """
+    other = 1 - axis
+    n = poly.shape[0]
+    out = np.empty((2 * n, 2), dtype=np.float64)
+    k = 0
+
+    for i in range(n):
+        j = i + 1 if i + 1 < n else 0
+        a1, b1 = poly[i, axis], poly[i, other]
+        a2, b2 = poly[j, axis], poly[j, other]
+
+        current_inside = side * (a1 - bound) >= 0
+        next_inside = side * (a2 - bound) >= 0
+
+        if current_inside != next_inside:
+            # Crossing the edge - add intersection
+            t = (bound - a1) / (a2 - a1)
+            out[k, axis] = bound
+            out[k, other] = b1 + t * (b2 - b1)
+            k += 1
+
+        if next_inside:
+            out[k, 0] = poly[j, 0]
+            out[k, 1] = poly[j, 1]
+            k += 1
+
+    return out[:k].copy()
+
+
+@njit('float64[:,::1](float64[:,::1],float64,float64,float64,float64)', cache=True)
+def _sh_clip_rect(poly, x_min, y_min, x_max, y_max):
+    """
+    All four window passes in one compiled call - bottom, right, top, left,
+    stopping as soon as a pass leaves nothing; returns the clipped polygon
+    """
+    out = poly
+    if out.shape[0]:
+        out = _sh_clip_axis(out, 1, y_min, 1.0)
+    if out.shape[0]:
+        out = _sh_clip_axis(out, 0, x_max, -1.0)
+    if out.shape[0]:
+        out = _sh_clip_axis(out, 1, y_max, -1.0)
+    if out.shape[0]:
+        out = _sh_clip_axis(out, 0, x_min, 1.0)
+    return out
+
+
+# ============================================================================
+# WARM-UP
+# ============================================================================
+
+def warmup():
+    """
+    Run every kernel once on small int32 inputs
+    Every kernel has an eager signature, so compilation (or loading from the
+    cache=True on-disk cache) already happened at import; this pass also pays
+    the remaining first-call costs so they do not land on the first frame.
+    The game calls it once at startup; importing this module never does
+    """
+    if not HAVE_NUMBA:
+        return
+    _bresenham(0, 0, 10, 5, np.empty((11, 2), dtype=np.int32))
+    square = np.array([(0, 0), (4, 0), (4, 4), (0, 4)], dtype=np.int32)
+    _polygon_outline(square)
+    _polyline(square)
+    _line_segments(square.reshape(-1, 4))
+    _filled_polygon(square.astype(np.float64))
+    _filled_convex_polygon(square.astype(np.float64))
+    _midpoint_circle(0, 0, 5, np.empty((48, 2), dtype=np.int32))
+    _midpoint_ellipse(0, 0, 5, 3, np.empty((40, 2), dtype=np.int32))
+    _sh_clip_axis(square.astype(np.float64), 0, 2.0, 1.0)
+    _sh_clip_rect(square.astype(np.float64), 1.0, 1.0, 3.0, 3.0)
@@ -17,7 +17,6 @@ Author: Computer Graphics Project
 
 import sys
 import random
-import time
 
 # Pygame for window management and input
 import pygame
@@ -29,11 +28,12 @@ from OpenGL.GLU import *
 
 # Game modules
 from game_objects import (
-    Airplane, Missile, Cloud, FuelCanister, 
-    Star, Explosion, Ground
+    Airplane, MissilePool, Cloud, FuelCanister, 
+    StarField, Explosion, Ground
 )
 from renderer import OpenGLRenderer
 from graphics_algorithms import Transform2D
+from graphics_numba import warmup
 
 
 class GameState:
@@ -65,6 +65,9 @@ class AirplaneGame:
         self.renderer = OpenGLRenderer(width, height)
         self.renderer.init_gl()
         
+        # Pay the kernels' first-call costs now rather than on the first frame
+        warmup()
+        
         # Game clock
         self.clock = pygame.time.Clock()
         self.target_fps = 60
@@ -89,11 +92,17 @@ class AirplaneGame:
         # Player airplane
         self.airplane = Airplane(150, self.height // 2)
         
-        # Missiles (enemies)
-        self.missiles = []
+        # Missiles (enemies) - pooled, see MissilePool
+        self.missiles = MissilePool()
         self.missile_spawn_timer = 0
         self.missile_spawn_interval = 2.0  # seconds
         
+        # Live objects are kept in lists compacted in place every frame; removed
+        # objects go to free lists and are reset on the next spawn
+        self._free_clouds = []
+        self._free_fuel = []
+        self._free_explosions = []
+        
         # Clouds (decoration)
         self.clouds = []
         for _ in range(5):
@@ -107,12 +116,7 @@ class AirplaneGame:
         self.fuel_spawn_interval = 8.0  # seconds
         
         # Stars (background parallax)
-        self.stars = []
-        for layer in range(3):
-            for _ in range(20):
-                x = random.randint(0, self.width)
-                y = random.randint(100, self.height - 50)
-                self.stars.append(Star(x, y, layer))
+        self.stars = StarField(self.width, self.height)
         
         # Explosions
         self.explosions = []
@@ -172,21 +176,37 @@ class AirplaneGame:
     def spawn_missile(self):
         """Spawn a new missile from the right side"""
         y = random.randint(80, self.height - 80)
-        missile = Missile(self.width + 50, y)
-        self.missiles.append(missile)
+        self.missiles.spawn(self.width + 50, y)
     
     def spawn_fuel(self):
         """Spawn a fuel canister"""
         y = random.randint(100, self.height - 100)
-        fuel = FuelCanister(self.width + 30, y)
+        if self._free_fuel:
+            fuel = self._free_fuel.pop()
+            fuel.reset(self.width + 30, y)
+        else:
+            fuel = FuelCanister(self.width + 30, y)
         self.fuel_canisters.append(fuel)
     
     def spawn_cloud(self):
         """Spawn a new cloud"""
         y = random.randint(self.height // 2, self.height - 50)
-        cloud = Cloud(self.width + 50, y)
+        if self._free_clouds:
+            cloud = self._free_clouds.pop()
+            cloud.reset(self.width + 50, y)
+        else:
+            cloud = Cloud(self.width + 50, y)
         self.clouds.append(cloud)
     
+    def spawn_explosion(self, x: float, y: float):
+        """Spawn an explosion effect at (x, y)"""
+        if self._free_explosions:
+            explosion = self._free_explosions.pop()
+            explosion.reset(x, y)
+        else:
+            explosion = Explosion(x, y)
+        self.explosions.append(explosion)
+    
     def update(self, dt: float):
         """Update game state"""
         if self.state != GameState.PLAYING:
@@ -197,7 +217,7 @@ class AirplaneGame:
         
         # Check for game over (out of fuel)
         if self.airplane.fuel <= 0:
-            self.explosions.append(Explosion(self.airplane.x, self.airplane.y))
+            self.spawn_explosion(self.airplane.x, self.airplane.y)
             self.state = GameState.GAME_OVER
             return
         
@@ -227,55 +247,63 @@ class AirplaneGame:
             self.spawn_fuel()
             self.fuel_spawn_timer = 0
         
-        # Update missiles
-        for missile in self.missiles[:]:
-            missile.update(dt)
-            
-            # Check collision with airplane
-            if missile.collides_with(self.airplane):
-                self.explosions.append(Explosion(self.airplane.x, self.airplane.y))
-                self.state = GameState.GAME_OVER
-                return
-            
-            # Remove if off screen
-            if missile.x < -100:
-                self.missiles.remove(missile)
-                self.missiles_dodged += 1
+        # Update missiles (all at once)
+        self.missiles.update_all(dt)
+        
+        # Check collision with airplane
+        if self.missiles.first_collision(self.airplane) is not None:
+            self.spawn_explosion(self.airplane.x, self.airplane.y)
+            self.state = GameState.GAME_OVER
+            return
+        
+        # Remove if off screen
+        self.missiles_dodged += self.missiles.despawn_behind(-100)
         
-        # Update fuel canisters
-        for fuel in self.fuel_canisters[:]:
+        # Update fuel canisters (survivors are compacted to the front of the list)
+        keep = 0
+        for fuel in self.fuel_canisters:
             fuel.update(dt)
             
             # Check collection
             if fuel.collides_with(self.airplane):
                 self.airplane.fuel = min(self.airplane.max_fuel, 
                                         self.airplane.fuel + fuel.fuel_amount)
-                self.fuel_canisters.remove(fuel)
+                self._free_fuel.append(fuel)
             elif fuel.x < -50:
-                self.fuel_canisters.remove(fuel)
+                self._free_fuel.append(fuel)
+            else:
+                self.fuel_canisters[keep] = fuel
+                keep += 1
+        del self.fuel_canisters[keep:]
         
         # Update clouds
-        for cloud in self.clouds[:]:
+        keep = 0
+        for cloud in self.clouds:
             cloud.update(dt)
             if cloud.x < -100:
-                self.clouds.remove(cloud)
+                self._free_clouds.append(cloud)
+            else:
+                self.clouds[keep] = cloud
+                keep += 1
+        del self.clouds[keep:]
         
         # Spawn new clouds occasionally
         if random.random() < 0.02:
             self.spawn_cloud()
         
         # Update stars (parallax)
-        for star in self.stars:
-            star.update(dt)
-            if star.x < 0:
-                star.x = self.width
-                star.y = random.randint(100, self.height - 50)
+        self.stars.update(dt)
         
         # Update explosions
-        for explosion in self.explosions[:]:
+        keep = 0
+        for explosion in self.explosions:
             explosion.update(dt)
             if not explosion.active:
-                self.explosions.remove(explosion)
+                self._free_explosions.append(explosion)
+            else:
+                self.explosions[keep] = explosion
+                keep += 1
+        del self.explosions[keep:]
         
         # Update ground
         self.ground.update(dt, effective_speed)
@@ -295,23 +323,26 @@ class AirplaneGame:
             )
             
             # Draw stars (far background)
-            for star in self.stars:
-                self.renderer.draw_star(star)
+            self.renderer.draw_star_field(self.stars)
+            
+            # Objects entirely outside the viewport skip rasterization altogether
+            w, h = self.width, self.height
             
             # Draw clouds
-            for cloud in self.clouds:
-                self.renderer.draw_cloud(cloud)
+            self.renderer.draw_clouds([cloud for cloud in self.clouds if cloud.is_visible(w, h)])
             
             # Draw ground
             self.renderer.draw_ground(self.ground)
             
             # Draw fuel canisters
             for fuel in self.fuel_canisters:
-                self.renderer.draw_fuel(fuel)
+                if fuel.is_visible(w, h):
+                    self.renderer.draw_fuel(fuel)
             
             # Draw missiles
             for missile in self.missiles:
-                self.renderer.draw_missile(missile)
+                if missile.is_visible(w, h):
+                    self.renderer.draw_missile(missile)
             
             # Draw airplane
             if self.state != GameState.GAME_OVER:
@@ -319,7 +350,8 @@ class AirplaneGame:
             
             # Draw explosions
             for explosion in self.explosions:
-                self.renderer.draw_explosion(explosion)
+                if explosion.is_visible(w, h):
+                    self.renderer.draw_explosion(explosion)
             
             # Draw HUD
             self.renderer.draw_hud(self.airplane, self.distance, self.missiles_dodged)
@@ -332,19 +364,14 @@ class AirplaneGame:
             elif self.state == GameState.GAME_OVER:
                 self.renderer.draw_game_over(self.distance, self.missiles_dodged)
         
-        # Swap buffers
+        # Draw whatever is still batched, then swap buffers
+        self.renderer.flush()
         pygame.display.flip()
     
     def draw_pause_overlay(self):
         """Draw pause screen overlay"""
         # Semi-transparent overlay
-        glColor4f(0, 0, 0, 0.5)
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(self.width, 0)
-        glVertex2f(self.width, self.height)
-        glVertex2f(0, self.height)
-        glEnd()
+        self.renderer.draw_overlay((0, 0, 0), 0.5)
         
         # Pause text
         self.renderer.draw_text_bitmap(
@@ -358,13 +385,9 @@ class AirplaneGame:
     
     def run(self):
         """Main game loop"""
-        last_time = time.time()
-        
         while self.running:
-            # Calculate delta time
-            current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
+            # Cap frame rate; tick returns the milliseconds since the last call
+            dt = self.clock.tick(self.target_fps) * 0.001
             
             # Cap delta time to prevent huge jumps
             dt = min(dt, 0.1)
@@ -377,9 +400,6 @@ class AirplaneGame:
             
             # Render
             self.render()
-            
-            # Cap frame rate
-            self.clock.tick(self.target_fps)
         
         pygame.quit()
 
@@ -0,0 +1,27 @@
+"""
+Random Pool Module
+Shared NumPy generator for game objects and the renderer,
+with pooled scalar draws for per-frame effects
+"""
+
+import numpy as np
+
+# Shared generator for batched draws (one call per field instead of per element)
+rng = np.random.default_rng()
+
+# Uniform [0, 1) draws for per-frame effects, generated 256 at a time
+_pool = []
+
+
+def randint(low: int, high: int) -> int:
+    """Random integer in [low, high] (inclusive, like random.randint) from the shared pool"""
+    global _pool
+    if not _pool:
+        _pool = rng.random(256).tolist()
+    return low + int(_pool.pop() * (high - low + 1))
+
+
+def seed(value: int):
+    """Reseed the shared generator in place and drop pooled draws"""
+    rng.bit_generator.state = np.random.PCG64(value).state
+    _pool.clear()
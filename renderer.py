@@ -5,9 +5,16 @@ Handles all OpenGL rendering using custom graphics algorithms
 
 from OpenGL.GL import *
 from OpenGL.GLU import *
+import ctypes
+import functools
 import numpy as np
 from typing import List, Tuple, Dict
-from graphics_algorithms import CohenSutherland, SutherlandHodgman
+from graphics_algorithms import (
+    LiangBarsky, SutherlandHodgman,
+    bresenham_line, midpoint_circle, filled_circle,
+    midpoint_ellipse, filled_ellipse, filled_polygon, polygon_from_lines
+)
+from random_pool import randint
 
 
 class OpenGLRenderer:
@@ -18,11 +25,24 @@ class OpenGLRenderer:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.pixel_buffer = {}  # Cache for pixels
         
         # Clipping window (viewport)
-        self.clipper = CohenSutherland(0, 0, width, height)
+        self.clipper = LiangBarsky(0, 0, width, height)
         self.poly_clipper = SutherlandHodgman(0, 0, width, height)
+        
+        # Frame batch: consecutive draws of one (primitive type, point size) in one
+        # vertex buffer, as [color, vertex count] runs
+        self._batch_mode = None
+        self._batch_vertices = []
+        self._batch_runs = []
+        
+        # Last color / point size / blend state handed to GL, so repeated values skip the call
+        self._gl_color = None
+        self._gl_point_size = None
+        self._gl_blend = None
+        
+        # Start screen airplane as ready-made point vertices, built on first use
+        self._menu_plane = None
     
     def init_gl(self):
         """Initialize OpenGL settings"""
@@ -33,15 +53,50 @@ class OpenGLRenderer:
         glMatrixMode(GL_MODELVIEW)
         glLoadIdentity()
         
-        # Enable blending for transparency
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        # A fresh context starts from unknown state, so drop the cached values
+        self._gl_color = None
+        self._gl_point_size = None
+        self._gl_blend = None
         
-        # Enable textures for text
-        glEnable(GL_TEXTURE_2D)
+        # Blending for transparency; only enabled while drawing something translucent
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        self._set_blend(False)
+        
+        # Texturing stays off except while drawing text from the glyph atlas
+        glDisable(GL_TEXTURE_2D)
+        
+        # Point size for pixel rendering; larger sizes are set per batch by flush
+        self._set_point_size(1.0)
+        self._max_point_size = glGetFloatv(GL_ALIASED_POINT_SIZE_RANGE)[1]
+        
+        # Streaming vertex buffer for batched draws (refilled on every use)
+        self._stream_vbo = glGenBuffers(1)
+        
+        # Full-screen gradient quad: interleaved float32 (x, y) + uint8 RGBA per vertex,
+        # uploaded once; only the color bytes are rewritten, and only when they change
+        self._gradient = np.zeros(4, dtype=[('position', np.float32, 2), ('color', np.uint8, 4)])
+        self._gradient['position'] = [(0, 0), (self.width, 0), (self.width, self.height), (0, self.height)]
+        self._gradient_colors = None
+        self._gradient_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self._gradient_vbo)
+        glBufferData(GL_ARRAY_BUFFER, self._gradient.nbytes, self._gradient, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        # Unit quad [0, 1] x [0, 1] compiled once; scaled to cover the screen by draw_overlay
+        self._overlay_list = glGenLists(1)
+        glNewList(self._overlay_list, GL_COMPILE)
+        glBegin(GL_QUADS)
+        glVertex2f(0, 0)
+        glVertex2f(1, 0)
+        glVertex2f(1, 1)
+        glVertex2f(0, 1)
+        glEnd()
+        glEndList()
         
-        # Point size for pixel rendering
-        glPointSize(1.0)
+        # Start screen text as one interleaved position / texcoord / color buffer,
+        # built and uploaded on first use
+        self._start_text_vbo = None
+        self._start_text_count = 0
         
         # Font will be initialized when first needed
         self.font = None
@@ -102,6 +157,28 @@ class OpenGLRenderer:
             '/': [(3,6),(3,5),(2,4),(2,3),(1,2),(1,1),(0,0)],
             'm': [(0,4),(1,4),(3,4),(0,3),(2,3),(4,3),(0,2),(2,2),(4,2),(0,1),(2,1),(4,1),(0,0),(2,0),(4,0)],
         }
+        
+        # Glyph atlas: a 16 x 16 grid of 8 x 8 alpha cells indexed by character code,
+        # so a string becomes one textured quad per character
+        cell = self.char_height
+        atlas = np.zeros((16 * cell, 16 * cell), dtype=np.uint8)
+        for char, points in self.bitmap_chars.items():
+            code = ord(char)
+            for px, py in points:
+                atlas[(code // 16) * cell + py, (code % 16) * cell + px] = 255
+        
+        self._glyph_atlas = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self._glyph_atlas)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_ALPHA, atlas.shape[1], atlas.shape[0], 0,
+                     GL_ALPHA, GL_UNSIGNED_BYTE, atlas)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        
+        # Unit quad corners, and the texture coordinates of every atlas cell
+        self._glyph_corners = np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype=np.float32)
+        codes = np.arange(256)
+        self._glyph_uv = np.column_stack((codes % 16, codes // 16)).astype(np.float32) / 16
     
     def _init_fonts(self):
         """Initialize fonts on first use - now using bitmap fonts"""
@@ -109,64 +186,241 @@ class OpenGLRenderer:
     
     def clear(self):
         """Clear the screen"""
+        self.flush()
         glClear(GL_COLOR_BUFFER_BIT)
     
     def draw_pixel(self, x: int, y: int, color: Tuple[float, float, float], alpha: float = 1.0):
         """Draw a single pixel"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            glColor4f(color[0], color[1], color[2], alpha)
+            self.flush()
+            self._set_color((color[0], color[1], color[2], alpha))
+            self._set_point_size(1.0)
             glBegin(GL_POINTS)
             glVertex2f(x + 0.5, y + 0.5)
             glEnd()
     
-    def draw_pixels(self, pixels: List[Tuple[int, int]], color: Tuple[float, float, float], alpha: float = 1.0):
-        """Draw multiple pixels efficiently"""
-        if not pixels:
+    def draw_pixels(self, pixels: np.ndarray, color: Tuple[float, float, float], alpha: float = 1.0):
+        """Queue multiple pixels on the frame batch (accepts a list of tuples or an (N, 2) array)"""
+        if len(pixels) == 0:
             return
+        pixels = np.asarray(pixels).reshape(-1, 2)
         
-        glColor4f(color[0], color[1], color[2], alpha)
-        glBegin(GL_POINTS)
-        for x, y in pixels:
-            if 0 <= x < self.width and 0 <= y < self.height:
-                glVertex2f(x + 0.5, y + 0.5)
-        glEnd()
+        self._queue(self._point_vertices(pixels[self._onscreen(pixels)]), (*color, alpha), GL_POINTS)
     
-    def draw_pixels_large(self, pixels: List[Tuple[int, int]], color: Tuple[float, float, float], 
+    def draw_pixels_large(self, pixels: np.ndarray, color: Tuple[float, float, float], 
                           alpha: float = 1.0, size: int = 2):
-        """Draw pixels as small quads for better visibility"""
-        if not pixels:
+        """
+        Queue pixels as size x size squares for better visibility on the frame batch
+        Drawn as wide GL points - one vertex per pixel instead of four quad corners -
+        unless the driver's point size limit is smaller than size
+        """
+        if len(pixels) == 0:
             return
+        pixels = np.asarray(pixels).reshape(-1, 2)
+        pixels = pixels[self._onscreen(pixels)]
         
-        glColor4f(color[0], color[1], color[2], alpha)
+        if size <= self._max_point_size:
+            # An aliased point of even size covers the same pixels as the quad around (x, y)
+            self._queue(pixels.astype(np.float32), (*color, alpha), GL_POINTS, size)
+        else:
+            self._queue(self._quad_vertices(pixels, size), (*color, alpha), GL_QUADS)
+    
+    # ========================================================================
+    # BATCHED VERTEX-ARRAY DRAWING
+    # ========================================================================
+    
+    def _onscreen(self, pixels: np.ndarray) -> np.ndarray:
+        """Mask of the (N, 2) pixels that fall inside the window"""
+        if pixels.dtype == np.int32:
+            # Negative coordinates wrap to huge unsigned values, so one
+            # compare per axis covers both 0 <= v and v < limit
+            unsigned = pixels.view(np.uint32)
+            return (unsigned[:, 0] < self.width) & (unsigned[:, 1] < self.height)
+        return ((pixels[:, 0] >= 0) & (pixels[:, 0] < self.width) &
+                (pixels[:, 1] >= 0) & (pixels[:, 1] < self.height))
+    
+    @staticmethod
+    def _point_vertices(pixels: np.ndarray) -> np.ndarray:
+        """Pixels as GL_POINTS vertices at pixel centres, (N, 2) float32"""
+        return pixels.astype(np.float32) + 0.5
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _quad_corners(size: int) -> np.ndarray:
+        """Corner offsets of a size x size quad around a pixel, (4, 2) float32, read-only"""
         half = size / 2
+        corners = np.array([(-half, -half), (half, -half), (half, half), (-half, half)],
+                           dtype=np.float32)
+        corners.flags.writeable = False
+        return corners
+    
+    @staticmethod
+    def _quad_vertices(pixels: np.ndarray, size: int) -> np.ndarray:
+        """Pixels as GL_QUADS of the given size, 4 vertices each, (4N, 2) float32"""
+        # Broadcast the centers into the output, then add the corners in place in
+        # float32 - no float64 temporaries
+        vertices = np.empty((len(pixels), 4, 2), dtype=np.float32)
+        vertices[:] = pixels[:, None, :]
+        vertices += OpenGLRenderer._quad_corners(size)
+        return vertices.reshape(-1, 2)
+    
+    def _set_color(self, color: Tuple[float, float, float, float]):
+        """
+        Set the current RGBA color, skipping the GL call if it is already set
+        Blending follows the alpha: opaque colors are drawn without it
+        """
+        if color != self._gl_color:
+            glColor4f(*color)
+            self._gl_color = color
+        self._set_blend(color[3] < 1.0)
+    
+    def _set_blend(self, enabled: bool):
+        """Enable or disable GL_BLEND, skipping the GL call if it is already in that state"""
+        if enabled != self._gl_blend:
+            if enabled:
+                glEnable(GL_BLEND)
+            else:
+                glDisable(GL_BLEND)
+            self._gl_blend = enabled
+    
+    def _set_point_size(self, size: float):
+        """Set the GL point size, skipping the GL call if it is already set"""
+        if size != self._gl_point_size:
+            glPointSize(size)
+            self._gl_point_size = size
+    
+    def _queue(self, vertices: np.ndarray, color: Tuple[float, float, float, float], mode: int,
+               point_size: float = 1.0):
+        """
+        Append single-color vertices to the frame batch
+        Switching primitive type or point size flushes first, so everything is still
+        drawn in call order; a draw in the same color as the previous one extends its run
+        """
+        if len(vertices) == 0:
+            return
+        if (mode, point_size) != self._batch_mode:
+            self.flush()
+            self._batch_mode = (mode, point_size)
+        self._batch_vertices.append(vertices)
+        runs = self._batch_runs
+        if runs and runs[-1][0] == color:
+            runs[-1][1] += len(vertices)
+        else:
+            runs.append([color, len(vertices)])
+    
+    def flush(self):
+        """
+        Draw everything queued since the last flush from one buffer upload,
+        with one glDrawArrays per color run
+        Anything that issues GL calls itself must flush first to keep draw order;
+        the game loop flushes once more before swapping buffers
+        """
+        if not self._batch_vertices:
+            return
+        data = np.ascontiguousarray(np.concatenate(self._batch_vertices), dtype=np.float32)
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self._stream_vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STREAM_DRAW)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, ctypes.c_void_p(0))
+        mode, point_size = self._batch_mode
+        if mode == GL_POINTS:
+            self._set_point_size(point_size)
+        first = 0
+        for color, count in self._batch_runs:
+            self._set_color(color)
+            glDrawArrays(mode, first, count)
+            first += count
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        self._batch_vertices.clear()
+        self._batch_runs.clear()
+        self._batch_mode = None
+    
+    def _draw_vertices(self, vertices: np.ndarray, mode: int):
+        """Draw (N, 2) vertices in the current color with one glDrawArrays from the shared VBO"""
+        n = len(vertices)
+        if n == 0:
+            return
         
-        glBegin(GL_QUADS)
-        for x, y in pixels:
-            if 0 <= x < self.width and 0 <= y < self.height:
-                glVertex2f(x - half, y - half)
-                glVertex2f(x + half, y - half)
-                glVertex2f(x + half, y + half)
-                glVertex2f(x - half, y + half)
-        glEnd()
+        data = np.ascontiguousarray(vertices, dtype=np.float32)
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self._stream_vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STREAM_DRAW)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, ctypes.c_void_p(0))
+        glDrawArrays(mode, 0, n)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+    
+    def _draw_textured_vertices(self, vertices: np.ndarray, texcoords: np.ndarray, mode: int):
+        """
+        Draw (N, 2) vertices with (N, 2) texture coordinates in one glDrawArrays,
+        sampling whatever texture is bound; streamed like _draw_colored_vertices
+        """
+        n = len(vertices)
+        if n == 0:
+            return
+        
+        data = np.empty(n * 4, dtype=np.float32)
+        data[:2 * n] = vertices.ravel()
+        data[2 * n:] = texcoords.ravel()
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self._stream_vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STREAM_DRAW)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, ctypes.c_void_p(0))
+        glTexCoordPointer(2, GL_FLOAT, 0, ctypes.c_void_p(2 * n * 4))
+        glDrawArrays(mode, 0, n)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+    
+    def _draw_colored_vertices(self, vertices: np.ndarray, colors: np.ndarray, mode: int):
+        """
+        Draw (N, 2) vertices with per-vertex (N, 4) RGBA colors in one glDrawArrays
+        Positions and colors are streamed into the shared VBO back to back;
+        glBufferData re-specifies the store each time so the driver never
+        stalls on a buffer the GPU is still reading
+        """
+        n = len(vertices)
+        if n == 0:
+            return
+        
+        data = np.empty(n * 6, dtype=np.float32)
+        data[:2 * n] = vertices.ravel()
+        data[2 * n:] = colors.ravel()
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self._stream_vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STREAM_DRAW)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, ctypes.c_void_p(0))
+        glColorPointer(4, GL_FLOAT, 0, ctypes.c_void_p(2 * n * 4))
+        glDrawArrays(mode, 0, n)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        # The current color is undefined after drawing from a color array
+        self._gl_color = None
     
     def draw_line_bresenham(self, x1: int, y1: int, x2: int, y2: int, 
                             color: Tuple[float, float, float], alpha: float = 1.0):
         """Draw a line using Bresenham's algorithm with clipping"""
-        # Apply Cohen-Sutherland clipping
+        # Apply Liang-Barsky clipping
         accepted, (cx1, cy1, cx2, cy2) = self.clipper.clip_line(x1, y1, x2, y2)
         
         if not accepted:
             return
         
-        from graphics_algorithms import bresenham_line
         pixels = bresenham_line(int(cx1), int(cy1), int(cx2), int(cy2))
         self.draw_pixels(pixels, color, alpha)
     
     def draw_circle_midpoint(self, xc: int, yc: int, r: int, 
                              color: Tuple[float, float, float], filled: bool = False, alpha: float = 1.0):
         """Draw a circle using midpoint algorithm"""
-        from graphics_algorithms import midpoint_circle, filled_circle
-        
         if filled:
             pixels = filled_circle(xc, yc, r)
         else:
@@ -177,8 +431,6 @@ class OpenGLRenderer:
     def draw_ellipse_midpoint(self, xc: int, yc: int, rx: int, ry: int,
                               color: Tuple[float, float, float], filled: bool = False, alpha: float = 1.0):
         """Draw an ellipse using midpoint algorithm"""
-        from graphics_algorithms import midpoint_ellipse, filled_ellipse
-        
         if filled:
             pixels = filled_ellipse(xc, yc, rx, ry)
         else:
@@ -189,18 +441,16 @@ class OpenGLRenderer:
     def draw_polygon(self, vertices: List[Tuple[float, float]], 
                      color: Tuple[float, float, float], filled: bool = False, 
                      alpha: float = 1.0, clip: bool = True):
-        """Draw a polygon using Bresenham's lines, with optional clipping"""
-        if not vertices:
+        """Draw a polygon using Bresenham's lines, with optional clipping (list or (N, 2) array)"""
+        if len(vertices) == 0:
             return
         
         # Apply Sutherland-Hodgman clipping if enabled
         if clip:
             vertices = self.poly_clipper.clip_polygon(vertices)
-            if not vertices:
+            if len(vertices) == 0:
                 return
         
-        from graphics_algorithms import filled_polygon, polygon_from_lines
-        
         if filled:
             pixels = filled_polygon(vertices)
         else:
@@ -210,7 +460,17 @@ class OpenGLRenderer:
     
     def draw_rectangle(self, x: float, y: float, width: float, height: float,
                        color: Tuple[float, float, float], filled: bool = True, alpha: float = 1.0):
-        """Draw a rectangle"""
+        """
+        Draw an axis-aligned rectangle (HUD panels and bars)
+        Filled rectangles are one GL quad on the frame batch covering the same pixels
+        the scanline fill would: columns x..x+width, rows y..y+height-1
+        """
+        if filled:
+            x1, y1 = x + width + 1, y + height
+            vertices = np.array([(x, y), (x1, y), (x1, y1), (x, y1)], dtype=np.float32)
+            self._queue(vertices, (color[0], color[1], color[2], alpha), GL_QUADS)
+            return
+        
         vertices = [
             (x, y),
             (x + width, y),
@@ -219,33 +479,81 @@ class OpenGLRenderer:
         ]
         self.draw_polygon(vertices, color, filled, alpha)
     
+    def draw_rect_outline(self, x: float, y: float, width: float, height: float,
+                          color: Tuple[float, float, float], alpha: float = 1.0):
+        """
+        Draw an axis-aligned rectangle border as four GL_LINES in one draw call (GL clips it)
+        GL leaves out each line's last pixel, so every line runs one pixel past its
+        end to cover the same inclusive pixels as a Bresenham line
+        """
+        x0, y0 = x + 0.5, y + 0.5
+        x1, y1 = x0 + width, y0 + height
+        vertices = np.array([
+            (x0, y0), (x1 + 1, y0),      # Bottom
+            (x0, y1), (x1 + 1, y1),      # Top
+            (x0, y0), (x0, y1 + 1),      # Left
+            (x1, y0), (x1, y1 + 1),      # Right
+        ], dtype=np.float32)
+        
+        self.flush()
+        self._set_color((color[0], color[1], color[2], alpha))
+        self._draw_vertices(vertices, GL_LINES)
+    
     def draw_gradient_background(self, top_color: Tuple[float, float, float],
                                   bottom_color: Tuple[float, float, float]):
-        """Draw a vertical gradient background"""
-        glBegin(GL_QUADS)
-        glColor3f(*bottom_color)
-        glVertex2f(0, 0)
-        glVertex2f(self.width, 0)
-        glColor3f(*top_color)
-        glVertex2f(self.width, self.height)
-        glVertex2f(0, self.height)
-        glEnd()
+        """Draw a vertical gradient background from the persistent gradient VBO"""
+        self.flush()
+        self._set_blend(False)
+        stride = self._gradient.itemsize
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self._gradient_vbo)
+        if (top_color, bottom_color) != self._gradient_colors:
+            self._gradient_colors = (top_color, bottom_color)
+            rgb = np.rint(np.array([bottom_color, bottom_color, top_color, top_color]) * 255)
+            self._gradient['color'][:, :3] = rgb
+            self._gradient['color'][:, 3] = 255
+            glBufferSubData(GL_ARRAY_BUFFER, 0, self._gradient.nbytes, self._gradient)
+        
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glColorPointer(4, GL_UNSIGNED_BYTE, stride, ctypes.c_void_p(8))
+        glDrawArrays(GL_QUADS, 0, 4)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self._gl_color = None
+    
+    def _text_quads(self, x: int, y: int, text: str, large: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """(N, 2) quad vertices and matching atlas texture coordinates for a line of text"""
+        scale = 2 if large else 1
+        # Characters outside Latin-1 become '?', which has an empty cell like any unknown glyph
+        codes = np.frombuffer(text.upper().encode('latin-1', errors='replace'), dtype=np.uint8)
+        
+        size = self.char_height * scale
+        origins = np.empty((len(codes), 2), dtype=np.float32)
+        origins[:, 0] = x + np.arange(len(codes)) * (self.char_width * scale)
+        origins[:, 1] = y
+        vertices = (origins[:, None, :] + self._glyph_corners * size).reshape(-1, 2)
+        texcoords = (self._glyph_uv[codes][:, None, :] + self._glyph_corners / 16).reshape(-1, 2)
+        return vertices, texcoords
     
     def draw_text_bitmap(self, x: int, y: int, text: str, 
                          color: Tuple[float, float, float] = (1, 1, 1), large: bool = False):
-        """Draw text using our custom bitmap font with Bresenham-based pixels"""
-        scale = 2 if large else 1
-        cursor_x = x
-        
-        for char in text.upper():
-            if char in self.bitmap_chars:
-                pixels = []
-                for px, py in self.bitmap_chars[char]:
-                    for sx in range(scale):
-                        for sy in range(scale):
-                            pixels.append((cursor_x + px * scale + sx, y + py * scale + sy))
-                self.draw_pixels(pixels, color)
-            cursor_x += self.char_width * scale
+        """Draw text using our custom bitmap font, one textured quad per character"""
+        if not text:
+            return
+        vertices, texcoords = self._text_quads(x, y, text, large)
+        
+        self.flush()
+        self._set_color((color[0], color[1], color[2], 1.0))
+        # Glyph coverage lives in the atlas alpha, so text always blends
+        self._set_blend(True)
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self._glyph_atlas)
+        self._draw_textured_vertices(vertices, texcoords, GL_QUADS)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        glDisable(GL_TEXTURE_2D)
     
     # ========================================================================
     # HIGH-LEVEL DRAWING FUNCTIONS FOR GAME OBJECTS
@@ -279,13 +587,11 @@ class OpenGLRenderer:
         # Boost flame effect
         if airplane.is_boosting:
             # Draw engine flame
-            import random
             flame_x = int(airplane.x - 35)
             flame_y = int(airplane.y)
             flame_colors = [(1, 0.8, 0), (1, 0.5, 0), (1, 0.2, 0)]
             for i, color in enumerate(flame_colors):
-                length = random.randint(10, 25) - i * 5
-                from graphics_algorithms import filled_ellipse
+                length = randint(10, 25) - i * 5
                 pixels = filled_ellipse(flame_x - i * 8, flame_y, length, 4 - i)
                 self.draw_pixels(pixels, color, 0.8)
     
@@ -301,16 +607,16 @@ class OpenGLRenderer:
         
         # Draw flame
         flame_colors = [(1, 0.8, 0), (1, 0.5, 0), (1, 0.2, 0)]
-        import random
-        self.draw_pixels(render_data['flame'], flame_colors[random.randint(0, 2)], 0.9)
+        self.draw_pixels(render_data['flame'], flame_colors[randint(0, 2)], 0.9)
         
         # Draw outline
         self.draw_pixels(render_data['outline'], (0.2, 0.2, 0.2))
     
-    def draw_cloud(self, cloud):
-        """Draw a cloud using midpoint circles"""
-        render_data = cloud.get_render_data()
-        self.draw_pixels_large(render_data['circles'], cloud.color, cloud.alpha, size=2)
+    def draw_clouds(self, clouds):
+        """Draw clouds (filled circles); consecutive clouds share one batched draw call"""
+        for cloud in clouds:
+            self.draw_pixels_large(cloud.get_render_data()['circles'], cloud.color,
+                                   cloud.alpha, size=2)
     
     def draw_fuel(self, fuel):
         """Draw a fuel canister"""
@@ -325,19 +631,29 @@ class OpenGLRenderer:
         # Draw plus symbol (white)
         self.draw_pixels(render_data['symbol'], (1, 1, 1))
     
-    def draw_star(self, star):
-        """Draw a background star"""
-        render_data = star.get_render_data()
+    def draw_star_field(self, stars):
+        """Draw all background stars in a single batched draw call, colored per star"""
+        render_data = stars.get_render_data()
+        pixels = render_data['points']
+        
+        # Per-pixel color from its star's brightness
         brightness = render_data['brightness']
-        color = (brightness, brightness, brightness * 0.9)
-        self.draw_pixels(render_data['points'], color)
+        colors = np.column_stack((brightness, brightness, brightness * 0.9, np.ones_like(brightness)))
+        
+        inside = self._onscreen(pixels)
+        self.flush()
+        self._set_point_size(1.0)
+        self._set_blend(False)
+        self._draw_colored_vertices(self._point_vertices(pixels[inside]), colors[inside], GL_POINTS)
     
     def draw_explosion(self, explosion):
         """Draw an explosion effect"""
         render_data = explosion.get_render_data()
         
-        for particle in render_data['particles']:
-            self.draw_pixels(particle['points'], particle['color'], particle['alpha'])
+        alpha = render_data['alpha']
+        
+        for points, color in zip(render_data['points'], render_data['colors'].tolist()):
+            self.draw_pixels(points, color, alpha)
     
     def draw_ground(self, ground):
         """Draw the scrolling ground"""
@@ -372,11 +688,8 @@ class OpenGLRenderer:
             
             self.draw_rectangle(x + 2, y + 2, fuel_width, height - 4, color)
         
-        # Border using Bresenham lines
-        self.draw_line_bresenham(x, y, x + width, y, (1, 1, 1))
-        self.draw_line_bresenham(x, y + height, x + width, y + height, (1, 1, 1))
-        self.draw_line_bresenham(x, y, x, y + height, (1, 1, 1))
-        self.draw_line_bresenham(x + width, y, x + width, y + height, (1, 1, 1))
+        # Border
+        self.draw_rect_outline(x, y, width, height, (1, 1, 1))
     
     def draw_score(self, distance: int, missiles_dodged: int, x: int, y: int):
         """Draw the score display"""
@@ -387,16 +700,19 @@ class OpenGLRenderer:
         self.draw_text_bitmap(x + 10, y + 30, f"Distance: {distance}m", (1, 1, 1))
         self.draw_text_bitmap(x + 10, y + 10, f"Dodged: {missiles_dodged}", (1, 1, 0))
     
+    def draw_overlay(self, color: Tuple[float, float, float], alpha: float):
+        """Cover the whole screen with a translucent color (cached display list)"""
+        self.flush()
+        self._set_color((color[0], color[1], color[2], alpha))
+        glPushMatrix()
+        glScalef(self.width, self.height, 1)
+        glCallList(self._overlay_list)
+        glPopMatrix()
+    
     def draw_game_over(self, distance: int, missiles_dodged: int):
         """Draw game over screen"""
         # Darken background
-        glColor4f(0, 0, 0, 0.7)
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(self.width, 0)
-        glVertex2f(self.width, self.height)
-        glVertex2f(0, self.height)
-        glEnd()
+        self.draw_overlay((0, 0, 0), 0.7)
         
         # Game over panel
         panel_width = 400
@@ -407,10 +723,7 @@ class OpenGLRenderer:
         self.draw_rectangle(px, py, panel_width, panel_height, (0.1, 0.1, 0.2), alpha=0.9)
         
         # Border
-        self.draw_line_bresenham(px, py, px + panel_width, py, (1, 0.3, 0.3))
-        self.draw_line_bresenham(px, py + panel_height, px + panel_width, py + panel_height, (1, 0.3, 0.3))
-        self.draw_line_bresenham(px, py, px, py + panel_height, (1, 0.3, 0.3))
-        self.draw_line_bresenham(px + panel_width, py, px + panel_width, py + panel_height, (1, 0.3, 0.3))
+        self.draw_rect_outline(px, py, panel_width, panel_height, (1, 0.3, 0.3))
         
         # Text
         self.draw_text_bitmap(px + 130, py + 160, "GAME OVER", (1, 0.3, 0.3))
@@ -424,13 +737,51 @@ class OpenGLRenderer:
         # Background gradient
         self.draw_gradient_background((0.1, 0.1, 0.3), (0.0, 0.0, 0.1))
         
-        # Title
-        self.draw_text_bitmap(self.width // 2 - 100, self.height - 150, 
-                             "AIRPLANE GAME", (1, 1, 1))
+        # Title, subtitle and instructions never change: one cached draw
+        if self._start_text_vbo is None:
+            self._build_start_text()
+        
+        self.flush()
+        stride = 8 * 4
+        self._set_blend(True)
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self._glyph_atlas)
+        glBindBuffer(GL_ARRAY_BUFFER, self._start_text_vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glTexCoordPointer(2, GL_FLOAT, stride, ctypes.c_void_p(8))
+        glColorPointer(4, GL_FLOAT, stride, ctypes.c_void_p(16))
+        glDrawArrays(GL_QUADS, 0, self._start_text_count)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        glDisable(GL_TEXTURE_2D)
+        self._gl_color = None
         
-        # Subtitle
-        self.draw_text_bitmap(self.width // 2 - 150, self.height - 200,
-                             "Computer Graphics Mini Project", (0.7, 0.7, 0.9))
+        # Draw decorative airplane
+        # Simple airplane silhouette at a fixed spot, so its point vertices are built once
+        if self._menu_plane is None:
+            ax, ay = self.width // 2, self.height - 100
+            self._menu_plane = [
+                # Fuselage
+                (self._point_vertices(filled_ellipse(ax, ay, 40, 10)), (0.3, 0.6, 1.0, 1.0)),
+                # Wings
+                (self._point_vertices(filled_ellipse(ax - 10, ay, 10, 25)), (0.4, 0.7, 1.0, 1.0)),
+            ]
+        for vertices, color in self._menu_plane:
+            self._queue(vertices, color, GL_POINTS)
+    
+    def _build_start_text(self):
+        """Lay out every start screen text line once and upload it to its own VBO"""
+        lines = [
+            (self.width // 2 - 100, self.height - 150, "AIRPLANE GAME", (1, 1, 1)),
+            (self.width // 2 - 150, self.height - 200,
+             "Computer Graphics Mini Project", (0.7, 0.7, 0.9)),
+        ]
         
         # Instructions
         instructions = [
@@ -447,20 +798,28 @@ class OpenGLRenderer:
         
         y = self.height // 2 + 50
         for line in instructions:
-            self.draw_text_bitmap(self.width // 2 - 100, y, line, (0.8, 0.8, 0.8))
+            lines.append((self.width // 2 - 100, y, line, (0.8, 0.8, 0.8)))
             y -= 25
         
-        # Draw decorative airplane
-        from graphics_algorithms import bresenham_line, filled_ellipse
-        
-        # Simple airplane silhouette
-        ax, ay = self.width // 2, self.height - 100
-        # Fuselage
-        pixels = filled_ellipse(ax, ay, 40, 10)
-        self.draw_pixels(pixels, (0.3, 0.6, 1.0))
-        # Wings
-        wing_pixels = filled_ellipse(ax - 10, ay, 10, 25)
-        self.draw_pixels(wing_pixels, (0.4, 0.7, 1.0))
+        # Interleaved float32 (x, y, u, v, r, g, b, a) per vertex
+        blocks = []
+        for x, y, text, color in lines:
+            if not text:
+                continue
+            vertices, texcoords = self._text_quads(x, y, text)
+            block = np.empty((len(vertices), 8), dtype=np.float32)
+            block[:, 0:2] = vertices
+            block[:, 2:4] = texcoords
+            block[:, 4:7] = color
+            block[:, 7] = 1.0
+            blocks.append(block)
+        data = np.concatenate(blocks)
+        
+        self._start_text_count = len(data)
+        self._start_text_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self._start_text_vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
     
     def draw_hud(self, airplane, distance: int, missiles_dodged: int):
         """Draw the heads-up display"""